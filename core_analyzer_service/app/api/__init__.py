@@ -10,7 +10,8 @@ request/response handling, input validation, and endpoint routing.
 Modules
 -------
 analyzer_routes
-    Main router for complexity analysis endpoints (/analyze-ast, /health).
+    Main router for complexity analysis endpoints (/analyze-ast,
+    /analyze-ast/batch, /health).
 
 Design
 ------
@@ -6,14 +6,18 @@ analyzer_routes.py
 FastAPI router for algorithm complexity analysis endpoints.
 """
 
-from typing import Dict
+import logging
+from typing import List, Union
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Response
 
-from ..schemas import AnalyzeAstReq, analyzeAstResp
-from ..services import analyze_ast_core
+from ..schemas import AnalyzeAstReq, analyzeAstResp, BatchItemError
+from ..services import analyze_ast_json
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(
     prefix="",
     tags=["complexity-analysis"],
@@ -24,21 +28,62 @@ router = APIRouter(
 )
 
 
-@router.post("/analyze-ast", response_model=analyzeAstResp)
-def analyze_ast(req: AnalyzeAstReq) -> analyzeAstResp:
+def _analyze_one(req: AnalyzeAstReq) -> bytes:
     try:
-        return analyze_ast_core(req)
+        return analyze_ast_json(req)
     except NotImplementedError as e:
         raise HTTPException(status_code=501, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Error interno analizando el AST")
         raise HTTPException(status_code=500, detail=f"Internal analysis error: {str(e)}")
 
 
+# El servicio ya devuelve el analyzeAstResp serializado con orjson (y cacheado):
+# se envía tal cual, sin revalidarlo ni pasarlo por jsonable_encoder. El modelo
+# solo se declara para la documentación OpenAPI.
+@router.post("/analyze-ast", responses={200: {"model": analyzeAstResp}})
+def analyze_ast(req: AnalyzeAstReq) -> Response:
+    return Response(content=_analyze_one(req), media_type="application/json")
+
+
+# Máximo de AST por lote: se analizan en serie dentro de una sola petición, así
+# que un lote sin límite ocuparía el worker indefinidamente.
+_MAX_BATCH_SIZE = 64
+
+
+def _analyze_batch_item(req: AnalyzeAstReq) -> bytes:
+    try:
+        return _analyze_one(req)
+    except HTTPException as e:
+        return orjson.dumps({"status_code": e.status_code, "detail": e.detail})
+
+
+# Varios AST en una sola petición: se paga una vez el coste HTTP y de FastAPI.
+# Los análisis se ejecutan en orden en este proceso y comparten su caché de respuestas.
+# Un AST que falla no tumba el lote: su posición lleva un BatchItemError.
+@router.post(
+    "/analyze-ast/batch",
+    responses={
+        200: {"model": List[Union[analyzeAstResp, BatchItemError]]},
+        413: {"description": f"More than {_MAX_BATCH_SIZE} ASTs in one batch"},
+    },
+)
+def analyze_ast_batch(reqs: List[AnalyzeAstReq]) -> Response:
+    if len(reqs) > _MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(reqs)} ASTs (max {_MAX_BATCH_SIZE})",
+        )
+    body = b"[" + b",".join(_analyze_batch_item(req) for req in reqs) + b"]"
+    return Response(content=body, media_type="application/json")
+
+
+# El cuerpo de /health es constante: se serializa una sola vez al importar.
+_HEALTH_BODY = orjson.dumps({"status": "ok", "service": "core_analyzer"})
+
+
 @router.get("/health")
-def health_check() -> Dict[str, str]:
-    return {"status": "ok", "service": "core_analyzer"}
+def health_check() -> Response:
+    return Response(content=_HEALTH_BODY, media_type="application/json")
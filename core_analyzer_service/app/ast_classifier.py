@@ -196,6 +196,19 @@ def classify_algorithm(ast: dict) -> ProgramMetadata:
             calls=list(calls),
         )
 
+    # El recorrido de body ya está hecho aquí: se guarda la posición del primer
+    # procedimiento recursivo para que el servicio no tenga que buscarlo.
+    first_recursive_proc = next(
+        (
+            i
+            for i, item in enumerate(ast.get("body", []))
+            if isinstance(item, dict)
+            and item.get("kind") == "proc"
+            and item.get("name", "") in recursive_funcs
+        ),
+        None,
+    )
+
     if not recursive_funcs:
         algorithm_kind = "iterative"
     elif len(recursive_funcs) == len(call_graph):
@@ -206,6 +219,7 @@ def classify_algorithm(ast: dict) -> ProgramMetadata:
     return ProgramMetadata(
         algorithm_kind=algorithm_kind,
         functions=functions_meta,
+        first_recursive_proc=first_recursive_proc,
     )
 
 
@@ -2,7 +2,7 @@ from .expr import (
     Expr, Const, Sym, Pow, Log, Add, Mul, Alt,
     const, sym, log, add, mul, alt,
     degree, canonicalize_for_big_o, big_o_expr, big_o_str,
-    to_json, get_dominant_term,
+    to_json, to_json_many, get_dominant_term,
     big_o_str_from_expr, big_omega_str_from_expr,
     to_explicit_formula, to_explicit_formula_verbose
 )
@@ -22,14 +22,14 @@ from .recurrence import (
 from .ast_utils import (
     is_var, is_num, is_binop, get_line, extract_main_body, normalize_op,
     expr_uses_var, stmt_list_has_assign_to_var, collect_vars_in_expr,
-    expr_has_logical_op
+    expr_has_logical_op, LOOP_KINDS
 )
 
 __all__ = [
     "Expr", "Const", "Sym", "Pow", "Log", "Add", "Mul", "Alt",
     "const", "sym", "log", "add", "mul", "alt",
     "degree", "canonicalize_for_big_o", "big_o_expr", "big_o_str",
-    "to_json", "get_dominant_term",
+    "to_json", "to_json_many", "get_dominant_term",
     "big_o_str_from_expr", "big_omega_str_from_expr",
     "to_explicit_formula", "to_explicit_formula_verbose",
     "COST_MODEL",
@@ -39,5 +39,5 @@ __all__ = [
     "RecurrenceRelation", "RecursiveAnalysisResult",
     "is_var", "is_num", "is_binop", "get_line", "extract_main_body", "normalize_op",
     "expr_uses_var", "stmt_list_has_assign_to_var", "collect_vars_in_expr",
-    "expr_has_logical_op"
+    "expr_has_logical_op", "LOOP_KINDS"
 ]
\ No newline at end of file
@@ -1,4 +1,23 @@
-from typing import List, Tuple, Optional
+import json
+from typing import Any, List, Tuple, Optional
+
+import orjson
+
+
+# Tipos de sentencia que abren un bucle
+LOOP_KINDS = frozenset({"for", "while", "repeat"})
+
+
+def canonical_json(node: Any) -> bytes:
+    """Serializa un nodo del AST con claves ordenadas, para usarlo como clave de caché.
+
+    orjson es un orden de magnitud más rápido que json.dumps; solo se recurre a
+    este último para enteros fuera del rango de 64 bits, que orjson rechaza.
+    """
+    try:
+        return orjson.dumps(node, option=orjson.OPT_SORT_KEYS, default=str)
+    except TypeError:
+        return json.dumps(node, sort_keys=True, default=str).encode()
 
 
 def is_var(node, name: str = None) -> bool:
@@ -102,7 +121,7 @@ def stmt_list_has_assign_to_var(body: List[dict], varname: str) -> bool:
             elif kind == "block":
                 if _visit(st.get("stmts", [])):
                     return True
-            elif kind in ("for", "while", "repeat"):
+            elif kind in LOOP_KINDS:
                 if _visit(st.get("body", [])):
                     return True
         return False
@@ -1,3 +1,4 @@
+import os
 from typing import Optional, List, TYPE_CHECKING
 from dataclasses import dataclass
 
@@ -50,8 +51,6 @@ def cost_seq(*costs):
 
 
 def load_cost_model_from_env():
-    import os
-
     for key in COST_MODEL:
         env_key = f"COST_{key.upper()}"
         if env_key in os.environ:
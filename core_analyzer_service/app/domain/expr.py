@@ -1,5 +1,6 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, List, Dict
 import math
 
@@ -162,6 +163,8 @@ def alt(*xs: Expr) -> Expr:
     return Alt(tuple(opts))
 
 
+# Las Expr son inmutables y hashables, así que el grado se memoiza por valor
+@lru_cache(maxsize=1024)
 def degree(e: Expr) -> Tuple[int, int]:
     if isinstance(e, Const):
         return (0, 0)
@@ -271,25 +274,52 @@ def big_o_str(e: Expr) -> str:
     return "1"
 
 
+def _pow_to_json(e: Pow, conv):
+    if type(e.base) is Sym:
+        return {"pow": {"name": e.base.name, "exp": e.exp}}
+    return {"pow": {"base": conv(e.base), "exp": e.exp}}
+
+
+# Serializador de cada tipo de nodo: una búsqueda por nodo en lugar de una
+# cadena de isinstance. Los nodos del IR no tienen subclases. Cada serializador
+# recibe la función con la que convertir sus hijos.
+_TO_JSON = {
+    Const: lambda e, conv: {"k": e.k},
+    Sym: lambda e, conv: {"name": e.name},
+    Pow: _pow_to_json,
+    Log: lambda e, conv: {"log": {"arg": conv(e.arg), "base": e.base}},
+    Add: lambda e, conv: {"terms": [conv(t) for t in e.terms]},
+    Mul: lambda e, conv: {"factors": [conv(f) for f in e.factors]},
+    Alt: lambda e, conv: {"alt": [conv(o) for o in e.options]},
+}
+
+
 def to_json(e: Expr):
-    if isinstance(e, Const):
-        return {"k": e.k}
-    if isinstance(e, Sym):
-        return {"name": e.name}
-    if isinstance(e, Pow):
-        if isinstance(e.base, Sym):
-            return {"pow": {"name": e.base.name, "exp": e.exp}}
-        else:
-            return {"pow": {"base": to_json(e.base), "exp": e.exp}}
-    if isinstance(e, Log):
-        return {"log": {"arg": to_json(e.arg), "base": e.base}}
-    if isinstance(e, Add):
-        return {"terms": [to_json(t) for t in e.terms]}
-    if isinstance(e, Mul):
-        return {"factors": [to_json(f) for f in e.factors]}
-    if isinstance(e, Alt):
-        return {"alt": [to_json(o) for o in e.options]}
-    return str(e)
+    serialize = _TO_JSON.get(type(e))
+    if serialize is None:
+        return str(e)
+    return serialize(e, to_json)
+
+
+def to_json_many(*exprs: Expr | None) -> tuple:
+    """Serializa varias expresiones compartiendo el trabajo entre ellas.
+
+    Los subárboles que son el mismo objeto (habitual entre peor, mejor y
+    promedio) se convierten una sola vez y comparten el JSON resultante.
+    Las entradas None se devuelven como None.
+    """
+    memo: Dict[int, object] = {}
+
+    def conv(e: Expr):
+        key = id(e)
+        out = memo.get(key)
+        if out is None:
+            serialize = _TO_JSON.get(type(e))
+            out = str(e) if serialize is None else serialize(e, conv)
+            memo[key] = out
+        return out
+
+    return tuple(None if e is None else conv(e) for e in exprs)
 
 
 def get_dominant_term(e: Expr, dominant_func=max) -> Expr:
@@ -305,12 +335,16 @@ def get_dominant_term(e: Expr, dominant_func=max) -> Expr:
     return e
 
 
+# Cotas en texto memoizadas por valor, como degree(): cada petición las pide
+# varias veces sobre las mismas expresiones (peor, mejor, notas del caso mixto).
+@lru_cache(maxsize=1024)
 def big_o_str_from_expr(e: Expr) -> str:
     e = canonicalize_for_big_o(e)
     dominant_term = get_dominant_term(e, dominant_func=max)
     return big_o_str(dominant_term)
 
 
+@lru_cache(maxsize=1024)
 def big_omega_str_from_expr(e: Expr) -> str:
     e = canonicalize_for_big_o(e)
 
@@ -76,7 +76,8 @@ class SourceMapper:
         Añade el campo 'text' a cada entrada de análisis línea por línea.
 
         Soporta tanto diccionarios como objetos Pydantic (LineCost).
-        Devuelve siempre una lista de diccionarios.
+        Devuelve siempre una lista de diccionarios. Los diccionarios recibidos
+        se anotan en el lugar, sin copiarlos.
         """
         annotated: List[Dict] = []
 
@@ -84,7 +85,7 @@ class SourceMapper:
             # 1) Normalizar a diccionario + obtener número de línea
             if isinstance(line_data, dict):
                 line_num = line_data.get("line")
-                line_dict = dict(line_data)
+                line_dict = line_data
             else:
                 # Pydantic u otro objeto con atributo 'line'
                 line_num = getattr(line_data, "line", None)
@@ -8,6 +8,8 @@ from typing import List, Dict, Any, Optional
 from dataclasses import dataclass
 import re
 
+from .ast_utils import LOOP_KINDS
+
 @dataclass
 class Summation:
     """Representa una sumatoria matemática.
@@ -143,15 +145,18 @@ def _count_loop_depth(stmts: List[dict], depth: int = 0) -> int:
         
         kind = stmt.get("kind")
         
-        if kind in ("for", "while", "repeat"):
+        if kind in LOOP_KINDS:
             body = stmt.get("body", [])
             nested_depth = _count_loop_depth(body, depth + 1)
             max_depth = max(max_depth, nested_depth)
         
         elif kind == "if":
             then_depth = _count_loop_depth(stmt.get("then_body", []), depth)
-            else_depth = _count_loop_depth(stmt.get("else_body", []), depth)
-            max_depth = max(max_depth, then_depth, else_depth)
+            max_depth = max(max_depth, then_depth)
+            else_body = stmt.get("else_body")
+            if else_body:
+                else_depth = _count_loop_depth(else_body, depth)
+                max_depth = max(max_depth, else_depth)
         
         elif kind == "block":
             block_depth = _count_loop_depth(stmt.get("stmts", []), depth)
@@ -14,6 +14,7 @@ from ..domain import (
     cost_assign, cost_compare, cost_seq,
     LineCostInternal, degree
 )
+from ..domain.expr import log as make_log
 from ..domain.ast_utils import is_var, is_num, get_line
 
 from .patterns_for import (
@@ -397,10 +398,8 @@ def analyze_while(
             if k:
                 init = env.get(ctrl_var)
                 if init and init[0] == "sym":
-                    from ..domain.expr import log as make_log
                     iters = make_log(sym(init[1]), const(k))
                 else:
-                    from ..domain.expr import log as make_log
                     iters = make_log(sym("n"), const(k))
 
         th = cond_var_lt_sym_or_const(cond, ctrl_var)
@@ -408,7 +407,6 @@ def analyze_while(
             k = assign_mul_const(body, ctrl_var)
             if k:
                 if th[0] == "sym":
-                    from ..domain.expr import log as make_log
                     iters = make_log(sym(th[1]), const(k))
                 else:
                     iters = const(1)
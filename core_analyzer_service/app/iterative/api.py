@@ -6,7 +6,6 @@ from ..domain import (
     ProgramCost, LineCostInternal
 )
 from ..domain.ast_utils import extract_main_body
-from ..schemas import LineCost
 
 from .analyzer_core import analyze_stmt_list
 from .execution_trace import generate_execution_trace, ExecutionTrace
@@ -64,24 +63,28 @@ def analyze_iterative_program(ast: dict) -> ProgramCost:
     )
 
 
-def serialize_line_costs(lines: list[LineCostInternal]) -> list[LineCost]:
+def serialize_line_costs(lines: list[LineCostInternal]) -> list[Dict[str, Any]]:
     """Serializa costos de línea internos a formato público.
     
+    Devuelve diccionarios con los campos de ``LineCost`` en lugar de modelos:
+    la respuesta los valida una sola vez al construirse, y así se evita
+    crear cada modelo dos veces cuando se anotan con el texto fuente.
+    
     Args:
         lines: Lista de costos de línea internos
         
     Returns:
-        Lista de objetos LineCost serializados
+        Lista de diccionarios con los campos de LineCost
     """
     return [
-        LineCost(
-            line=lc.line,
-            kind=lc.kind,
-            text=lc.text,
-            multiplier=big_o_str_from_expr(lc.multiplier),
-            cost_worst=big_o_str_from_expr(lc.cost_worst),
-            cost_best=big_omega_str_from_expr(lc.cost_best),
-            cost_avg=big_o_str_from_expr(lc.cost_avg) if lc.cost_avg else None,
-        )
+        {
+            "line": lc.line,
+            "kind": lc.kind,
+            "text": lc.text,
+            "multiplier": big_o_str_from_expr(lc.multiplier),
+            "cost_worst": big_o_str_from_expr(lc.cost_worst),
+            "cost_best": big_omega_str_from_expr(lc.cost_best),
+            "cost_avg": big_o_str_from_expr(lc.cost_avg) if lc.cost_avg else None,
+        }
         for lc in lines
     ]
\ No newline at end of file
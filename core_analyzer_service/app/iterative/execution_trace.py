@@ -9,6 +9,7 @@ Este módulo simula la ejecución del pseudocódigo paso a paso, registrando:
 Es el equivalente al árbol de recursión, pero para algoritmos iterativos.
 """
 
+import math
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 
@@ -279,7 +280,6 @@ def generate_trace_for_binary_search(
         else:
             left = mid + 1
     
-    import math
     iterations = math.ceil(math.log2(n_value)) if n_value > 0 else 0
     
     return ExecutionTrace(
@@ -4,7 +4,7 @@ from ..domain import Expr, sym, const, log
 from ..domain.ast_utils import (
     is_var, is_num, is_binop, normalize_op,
     expr_uses_var, stmt_list_has_assign_to_var,
-    collect_vars_in_expr, expr_has_logical_op
+    collect_vars_in_expr, expr_has_logical_op, LOOP_KINDS
 )
 
 
@@ -177,7 +177,7 @@ def find_linear_index_var(body: List[dict]) -> Optional[str]:
                 if found:
                     return found
 
-            elif kind in ("for", "while", "repeat"):
+            elif kind in LOOP_KINDS:
                 found = _visit(st.get("body", []))
                 if found:
                     return found
@@ -190,7 +190,7 @@ def find_linear_index_var(body: List[dict]) -> Optional[str]:
 def body_has_nested_loops(body: List[dict]) -> bool:
     for st in body:
         kind = st.get("kind")
-        if kind in ("for", "while", "repeat"):
+        if kind in LOOP_KINDS:
             return True
         if kind == "if":
             if body_has_nested_loops(st.get("then_body", [])):
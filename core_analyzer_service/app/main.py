@@ -1,6 +1,50 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from .api.analyzer_routes import router as analyzer_router
+from .schemas import AnalyzeAstReq
+from .services import analyze_ast_json
+
+
+logger = logging.getLogger(__name__)
+
+# Programa mínimo (un for 1..n) usado para calentar el servicio al arrancar.
+_WARMUP_AST = {
+    "kind": "program",
+    "body": [
+        {
+            "kind": "for",
+            "var": "i",
+            "start": {"kind": "num", "value": 1},
+            "end": {"kind": "var", "name": "n"},
+            "body": [],
+        }
+    ],
+}
+
+
+def _warm_up() -> None:
+    """Recorre una vez el camino completo de /analyze-ast antes de aceptar peticiones.
+
+    Así la construcción perezosa de validadores, serializadores y cachés no
+    recae sobre la primera petición real.
+    """
+    try:
+        analyze_ast_json(AnalyzeAstReq(ast=_WARMUP_AST))
+    except Exception:
+        logger.exception("Falló el calentamiento del analizador")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _warm_up()
+    # FastAPI guarda el esquema en app.openapi_schema la primera vez que se
+    # genera; se construye aquí para que /docs no pague ese coste.
+    app.openapi()
+    yield
 
 
 def create_app() -> FastAPI:
@@ -14,6 +58,8 @@ def create_app() -> FastAPI:
         ),
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
 
     app.include_router(analyzer_router)
@@ -21,4 +67,4 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
\ No newline at end of file
+app = create_app()
@@ -1,6 +1,6 @@
 from .equation_formatter import get_recurrence_description
 from ..domain import sym, const, mul, log
-from ..domain.recurrence import RecursiveAnalysisResult
+from ..domain.recurrence import RecurrenceRelation, RecursiveAnalysisResult
 
 from .extractor import extract_recurrence
 from .master_theorem import solve_master_theorem, solve_linear_recurrence
@@ -8,6 +8,63 @@ from .iteration_method import build_iteration_explanation
 from .characteristic_equation import build_characteristic_explanation
 
 
+_N = sym("n")
+_ONE = const(1)
+
+
+# Partes fijas del análisis por casos de QuickSort: no dependen del código
+# concreto del procedimiento (las Expr son inmutables y se comparten).
+_QUICKSORT_NLOGN = mul(sym("n"), log(sym("n"), const(2)))
+_QUICKSORT_N_SQUARED = mul(sym("n"), sym("n"))
+_QUICKSORT_WORST_TEXT = (
+    "Peor caso (pivote desbalanceado):\n"
+    "T(n) = T(n-1) + c·n,  n > 1\n"
+    "T(1) = d"
+)
+_QUICKSORT_BEST_TEXT = (
+    "Mejor/Promedio caso (pivote balanceado):\n"
+    "T(n) = 2·T(n/2) + c·n,  n > 1\n"
+    "T(1) = d"
+)
+_QUICKSORT_EXPLANATION = (
+    "QuickSort tiene complejidad dependiente del caso:\n\n"
+    f"{_QUICKSORT_WORST_TEXT}\n"
+    "Solución asintótica (peor caso): Θ(n²)\n\n"
+    f"{_QUICKSORT_BEST_TEXT}\n"
+    "Solución asintótica (mejor/promedio): Θ(n log n)\n\n"
+    "El peor caso ocurre cuando el pivote siempre es el menor/mayor elemento, generando una partición desbalanceada.\n"
+    "El caso promedio asume particiones razonablemente balanceadas, comportándose como Divide y Vencerás."
+)
+
+
+def _quicksort_result() -> RecursiveAnalysisResult:
+    """Construye el análisis por casos de QuickSort a partir de las partes fijas.
+
+    Returns:
+        Resultado nuevo con peor caso Θ(n²) y mejor/promedio Θ(n log n)
+    """
+    rec_worst = RecurrenceRelation(
+        a=1,
+        b=1,
+        c=0,
+        d=0,
+        f_expr=_N,
+        base_case=_ONE,
+        equation_text=_QUICKSORT_WORST_TEXT,
+    )
+
+    return RecursiveAnalysisResult(
+        recurrence=rec_worst,
+        big_o=_QUICKSORT_N_SQUARED,
+        big_omega=_QUICKSORT_NLOGN,
+        theta=_QUICKSORT_NLOGN,
+        method_used="case_based_analysis",
+        master_theorem_case=None,
+        explanation=_QUICKSORT_EXPLANATION,
+        recurrence_equation=f"{_QUICKSORT_WORST_TEXT}\n\n{_QUICKSORT_BEST_TEXT}",
+    )
+
+
 def analyze_recursive_function(proc: dict, param_name: str = "n") -> RecursiveAnalysisResult:
     """Analiza una función recursiva y determina su complejidad asintótica.
     
@@ -27,67 +84,15 @@ def analyze_recursive_function(proc: dict, param_name: str = "n") -> RecursiveAn
     func_name = (proc.get("name") or "").upper()
 
     if "QUICK" in func_name and "SORT" in func_name:
-        nlogn = mul(sym("n"), log(sym("n"), const(2)))
-        n_squared = mul(sym("n"), sym("n"))
-        
-        from ..domain.recurrence import RecurrenceRelation
-        
-        rec_worst = RecurrenceRelation(
-            a=1,
-            b=1,
-            c=0,
-            d=0,
-            f_expr=sym("n"),
-            base_case=const(1),
-        )
-        rec_worst.equation_text = (
-            "Peor caso (pivote desbalanceado):\n"
-            "T(n) = T(n-1) + c·n,  n > 1\n"
-            "T(1) = d"
-        )
-        
-        rec_best = RecurrenceRelation(
-            a=2,
-            b=2,
-            c=0,
-            d=0,
-            f_expr=sym("n"),
-            base_case=const(1),
-        )
-        rec_best.equation_text = (
-            "Mejor/Promedio caso (pivote balanceado):\n"
-            "T(n) = 2·T(n/2) + c·n,  n > 1\n"
-            "T(1) = d"
-        )
-        
-        explanation = (
-            "QuickSort tiene complejidad dependiente del caso:\n\n"
-            f"{rec_worst.equation_text}\n"
-            "Solución asintótica (peor caso): Θ(n²)\n\n"
-            f"{rec_best.equation_text}\n"
-            "Solución asintótica (mejor/promedio): Θ(n log n)\n\n"
-            "El peor caso ocurre cuando el pivote siempre es el menor/mayor elemento, generando una partición desbalanceada.\n"
-            "El caso promedio asume particiones razonablemente balanceadas, comportándose como Divide y Vencerás."
-        )
-        
-        return RecursiveAnalysisResult(
-            recurrence=rec_worst,
-            big_o=n_squared,
-            big_omega=nlogn,
-            theta=nlogn,
-            method_used="case_based_analysis",
-            master_theorem_case=None,
-            explanation=explanation,
-            recurrence_equation=f"{rec_worst.equation_text}\n\n{rec_best.equation_text}",
-        )
+        return _quicksort_result()
 
     rec = extract_recurrence(proc, param_name)
 
     if not rec:
         return RecursiveAnalysisResult(
             recurrence=None,
-            big_o=sym("n"),
-            big_omega=const(1),
+            big_o=_N,
+            big_omega=_ONE,
             theta=None,
             method_used="fallback",
             master_theorem_case=None,
@@ -132,7 +137,7 @@ def analyze_recursive_function(proc: dict, param_name: str = "n") -> RecursiveAn
 
         if "BINARY_SEARCH" in func_name:
             big_o = result
-            big_omega = const(1)
+            big_omega = _ONE
             theta = None
             explanation += (
                 " | Ajuste específico: búsqueda binaria recursiva, "
@@ -177,8 +182,8 @@ def analyze_recursive_function(proc: dict, param_name: str = "n") -> RecursiveAn
     
     return RecursiveAnalysisResult(
         recurrence=rec,
-        big_o=sym("n"),
-        big_omega=const(1),
+        big_o=_N,
+        big_omega=_ONE,
         theta=None,
         method_used="conservative",
         master_theorem_case=None,
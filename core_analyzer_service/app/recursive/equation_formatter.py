@@ -4,6 +4,8 @@ Convierte los parámetros de RecurrenceRelation en ecuaciones matemáticas
 claras y correctas para mostrar en la UI.
 """
 
+from functools import lru_cache
+
 from ..domain.recurrence import RecurrenceRelation
 from ..domain.expr import Expr, Const, Sym, Pow, Log, Mul, Add
 
@@ -102,18 +104,28 @@ def format_recurrence_equation(rec: RecurrenceRelation) -> str:
        T(n) = T(n-1) + c·n,  n > 1
        T(1) = d
     """
+    return _format_recurrence_equation(rec.a, rec.b, rec.c, rec.d, rec.f_expr)
+
+
+@lru_cache(maxsize=1024)
+def _format_recurrence_equation(a: int, b: int, c: int, d: int, f_expr: Expr) -> str:
+    """
+    Formatea la ecuación a partir de sus parámetros. Se memoiza porque en la
+    práctica se repite un conjunto pequeño de recurrencias (Fibonacci,
+    2·T(n/2) + n, ...); las Expr son inmutables y sirven como clave.
+    """
     lines = []
     
     # Formatear f(n)
-    f_str = format_f_expr(rec.f_expr)
+    f_str = format_f_expr(f_expr)
     
     # --- CASO 1: Divide & Conquer (a·T(n/b) + f(n)) ---
-    if rec.b > 1 and rec.c == 0 and rec.d == 0:
+    if b > 1 and c == 0 and d == 0:
         # T(n) = a·T(n/b) + f(n)
-        if rec.a == 1:
-            term = f"T(n/{rec.b})"
+        if a == 1:
+            term = f"T(n/{b})"
         else:
-            term = f"{rec.a}·T(n/{rec.b})"
+            term = f"{a}·T(n/{b})"
         
         lines.append(f"T(n) = {term} + {f_str},  n > 1")
         lines.append("T(1) = d")
@@ -121,12 +133,12 @@ def format_recurrence_equation(rec: RecurrenceRelation) -> str:
         return "\n".join(lines)
     
     # --- CASO 2: Recursión Lineal Simple (c·T(n-1) + f(n)) ---
-    if rec.b == 1 and rec.c == 0 and rec.d == 0:
+    if b == 1 and c == 0 and d == 0:
         # T(n) = a·T(n-1) + f(n)
-        if rec.a == 1:
+        if a == 1:
             term = "T(n-1)"
         else:
-            term = f"{rec.a}·T(n-1)"
+            term = f"{a}·T(n-1)"
         
         lines.append(f"T(n) = {term} + {f_str},  n > 1")
         lines.append("T(1) = d")
@@ -134,27 +146,27 @@ def format_recurrence_equation(rec: RecurrenceRelation) -> str:
         return "\n".join(lines)
     
     # --- CASO 3: Recursión Lineal de Orden 2 (Fibonacci-like) ---
-    if rec.b == 1 and rec.d > 0:
+    if b == 1 and d > 0:
         # T(n) = a·T(n-1) + c·T(n-2) + f(n)
         # NOTA: Para Fibonacci simple, a=1 y c=1 (un término de cada uno)
         terms = []
         
         # Término T(n-1)
-        if rec.a > 0:
-            if rec.a == 1:
+        if a > 0:
+            if a == 1:
                 terms.append("T(n-1)")
             else:
-                terms.append(f"{rec.a}·T(n-1)")
+                terms.append(f"{a}·T(n-1)")
         
         # Término T(n-2)
-        if rec.c > 0:
-            if rec.c == 1:
+        if c > 0:
+            if c == 1:
                 terms.append("T(n-2)")
             else:
-                terms.append(f"{rec.c}·T(n-2)")
+                terms.append(f"{c}·T(n-2)")
         
         equation = " + ".join(terms)
-        if f_str != "c" or rec.f_expr is not None:
+        if f_str != "c" or f_expr is not None:
             equation += f" + {f_str}"
         
         lines.append(f"T(n) = {equation},  n ≥ 2")
@@ -164,7 +176,7 @@ def format_recurrence_equation(rec: RecurrenceRelation) -> str:
         return "\n".join(lines)
     
     # --- FALLBACK: Forma genérica ---
-    lines.append(f"T(n) = {rec.a}·T(n-1) + {f_str},  n > 1")
+    lines.append(f"T(n) = {a}·T(n-1) + {f_str},  n > 1")
     lines.append("T(1) = d")
     
     return "\n".join(lines)
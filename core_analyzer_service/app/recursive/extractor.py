@@ -2,448 +2,469 @@
 
 Analiza el cuerpo de funciones recursivas para identificar patrones de
 recurrencia como divide-y-vencerás, Fibonacci, y recurrencias lineales.
+
+Todos los hechos que necesita la extracción (llamadas recursivas, divisores,
+anidamiento de bucles, llamadas externas y offsets tipo Fibonacci) se
+recolectan en un único recorrido del cuerpo mediante ``analyze_body``.
 """
 
-from typing import List, Dict, Any, Tuple, Optional, Set
+from collections import deque
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Tuple, Optional
 
 from ..domain import Expr, sym, const, Pow, Sym
 from ..domain.recurrence import RecurrenceRelation
+from .equation_formatter import format_recurrence_equation
+
+
+# Costos f(n) posibles del trabajo no recursivo (Expr inmutables, compartidas)
+_N = sym("n")
+_N2 = Pow(Sym("n"), 2)
+_N3 = Pow(Sym("n"), 3)
+_ONE = const(1)
+
+# Hechos que se recolectan dentro de una expresión según dónde aparece.
+_CALLS = 1  # llamadas recursivas (lado derecho de asignaciones)
+_DIVS = 2   # divisores de expresiones "/" o "div"
+_FIB = 4    # offsets k de llamadas recursivas f(n - k)
+
 
+@dataclass
+class BodyFacts:
+    """Hechos del cuerpo de una función recolectados en un único recorrido.
+
+    Attributes:
+        recursive_calls: Llamadas recursivas (en un ``if`` cuenta la rama con más llamadas)
+        min_divisor: Menor divisor constante mayor que 1 usado con ``/`` o ``div`` (1 si no hay)
+        max_loop_depth: Profundidad máxima de bucles anidados
+        has_external_call: Si hay llamadas a funciones distintas de la recursiva
+        fib_offsets: Offsets k de las llamadas recursivas de la forma f(n - k)
+        fib_possible: False en cuanto los offsets descartan el patrón Fibonacci
+    """
+    recursive_calls: int = 0
+    min_divisor: int = 1
+    max_loop_depth: int = 0
+    has_external_call: bool = False
+    fib_offsets: List[int] = field(default_factory=list)
+    fib_possible: bool = True
+
+
+# Manejadores de expresiones de _scan_expr. Reciben el nodo, la máscara de
+# hechos activa, el nombre de la función y el acumulador, y devuelven la
+# máscara con la que se recorren los hijos del nodo.
+def _visit_funcall(node, mask, func_name, facts):
+    if node.get("name") != func_name:
+        return mask
+    if mask & _CALLS:
+        facts.recursive_calls += 1
+    if mask & _FIB:
+        # Detectar si el argumento es una expresión binaria como n-1 o n-2
+        offset = _recursive_offset(node, func_name)
+        if offset is not None and facts.fib_possible:
+            facts.fib_offsets.append(offset)
+            # Fibonacci solo admite exactamente los offsets 1 y 2
+            if offset not in (1, 2) or len(facts.fib_offsets) > 2:
+                facts.fib_possible = False
+        # Los argumentos de una llamada recursiva no aportan más offsets
+        mask &= ~_FIB
+    return mask
+
+
+def _visit_binop(node, mask, func_name, facts):
+    if mask & _DIVS and node.get("op") in ("/", "div"):
+        right = node.get("right")
+        if isinstance(right, dict) and right.get("kind") == "num":
+            val = right.get("value")
+            if isinstance(val, int) and val > 1 and (facts.min_divisor == 1 or val < facts.min_divisor):
+                facts.min_divisor = val
+    return mask
+
+
+def _visit_index(node, mask, func_name, facts):
+    return mask & ~_FIB
+
+
+def _visit_unop(node, mask, func_name, facts):
+    return mask
+
+
+# Por tipo de expresión: (hijos directos, manejador). Los hijos permiten
+# recorrer el árbol con una pila explícita en lugar de recursión de Python.
+_EXPR_HANDLERS = {
+    "binop": (lambda e: (e.get("left"), e.get("right")), _visit_binop),
+    "unop": (lambda e: (e.get("expr"),), _visit_unop),
+    "index": (lambda e: (e.get("base"), e.get("index")), _visit_index),
+    "funcall": (lambda e: e.get("args", []), _visit_funcall),
+}
+
+
+def _scan_expr(expr: Dict[str, Any], mask: int, func_name: str, facts: BodyFacts) -> None:
+    """Recolecta en ``facts`` los hechos indicados por ``mask`` dentro de una expresión.
 
-def count_calls_in_expr(expr: Dict[str, Any], func_name: str) -> int:
-    """Cuenta llamadas recursivas dentro de una expresión.
-    
     Args:
         expr: Expresión a analizar
+        mask: Combinación de _CALLS, _DIVS y _FIB activos en la raíz
         func_name: Nombre de la función recursiva
-        
-    Returns:
-        Número de llamadas recursivas encontradas
+        facts: Acumulador de hechos
     """
-    if not isinstance(expr, dict):
-        return 0
+    if not facts.fib_possible:
+        # Fibonacci ya descartado: no hace falta seguir buscando offsets
+        mask &= ~_FIB
+    if facts.min_divisor == 2:
+        # 2 es el menor divisor posible: ningún otro puede mejorarlo
+        mask &= ~_DIVS
+    if not mask:
+        return
 
-    kind = expr.get("kind")
+    # Enlaces locales: el bucle se ejecuta una vez por nodo de la expresión
+    stack = deque([(expr, mask)])
+    pop, push = stack.pop, stack.extend
+    handler_of = _EXPR_HANDLERS.get
+    get = dict.get
 
-    if kind == "funcall":
-        count = 1 if expr.get("name") == func_name else 0
-        for arg in expr.get("args", []):
-            count += count_calls_in_expr(arg, func_name)
-        return count
+    while stack:
+        node, mask = pop()
+        # El AST llega como JSON decodificado: los nodos son dict exactos
+        if type(node) is not dict:
+            continue
 
-    if kind == "binop":
-        return (
-            count_calls_in_expr(expr.get("left"), func_name) +
-            count_calls_in_expr(expr.get("right"), func_name)
-        )
+        entry = handler_of(get(node, "kind"))
+        if entry is None:
+            continue
 
-    if kind == "unop":
-        return count_calls_in_expr(expr.get("expr"), func_name)
+        children, handler = entry
+        mask = handler(node, mask, func_name, facts)
+        if mask:
+            push((child, mask) for child in children(node))
 
-    if kind == "index":
-        return (
-            count_calls_in_expr(expr.get("base"), func_name) +
-            count_calls_in_expr(expr.get("index"), func_name)
-        )
 
-    return 0
+# Manejadores de sentencias de analyze_body. Reciben la sentencia, el nombre
+# de la función, el acumulador de hechos, la profundidad de bucles actual y
+# la pila de cuerpos pendientes.
+def _visit_call(stmt, func_name, facts, level, stack):
+    if stmt.get("name") == func_name:
+        facts.recursive_calls += 1
+    else:
+        facts.has_external_call = True
+    for arg in stmt.get("args", []):
+        _scan_expr(arg, _DIVS, func_name, facts)
 
 
-def count_calls_in_stmts(stmts: List[Dict[str, Any]], func_name: str) -> int:
-    """Cuenta llamadas recursivas en una lista de sentencias.
-    
-    Args:
-        stmts: Lista de sentencias a analizar
-        func_name: Nombre de la función recursiva
-        
-    Returns:
-        Número de llamadas recursivas encontradas
-    """
-    total = 0
+def _visit_assign(stmt, func_name, facts, level, stack):
+    expr = stmt.get("expr")
+    if isinstance(expr, dict) and expr.get("kind") == "funcall":
+        if expr.get("name") != func_name:
+            facts.has_external_call = True
+    _scan_expr(expr, _CALLS | _DIVS | _FIB, func_name, facts)
 
-    for stmt in stmts or []:
-        if not isinstance(stmt, dict):
-            continue
 
-        kind = stmt.get("kind")
+def _visit_return(stmt, func_name, facts, level, stack):
+    _scan_expr(stmt.get("expr"), _FIB, func_name, facts)
 
-        if kind == "call":
-            if stmt.get("name") == func_name:
-                total += 1
 
-        elif kind == "assign":
-            total += count_calls_in_expr(stmt.get("expr"), func_name)
+def _open_branches(facts, group):
+    group[0] = facts.recursive_calls
 
-        elif kind == "if":
-            then_c = count_calls_in_stmts(stmt.get("then_body", []), func_name)
-            else_body = stmt.get("else_body")
-            else_c = count_calls_in_stmts(else_body, func_name) if else_body else 0
-            total += max(then_c, else_c)
 
-        elif kind in ("while", "repeat", "for"):
-            total += count_calls_in_stmts(stmt.get("body", []), func_name)
+def _next_branch(facts, group):
+    group[1] = facts.recursive_calls - group[0]
+    facts.recursive_calls = group[0]
 
-        elif kind == "block":
-            total += count_calls_in_stmts(stmt.get("stmts", []), func_name)
 
-    return total
+def _close_branches(facts, group):
+    facts.recursive_calls = group[0] + max(group[1], facts.recursive_calls - group[0])
 
 
-def collect_divisors_expr(expr: Dict[str, Any], divisors: Set[int]) -> None:
-    """Recopila divisores usados en expresiones (para detectar divide-y-vencerás).
-    
-    Args:
-        expr: Expresión a analizar
-        divisors: Conjunto donde se agregarán los divisores encontrados
-    """
-    if not isinstance(expr, dict):
+def _visit_if(stmt, func_name, facts, level, stack):
+    _scan_expr(stmt.get("cond"), _DIVS, func_name, facts)
+
+    else_body = stmt.get("else_body")
+    if not else_body:
+        # Sin else (típico caso base): la rama then es el máximo, no hacen falta marcas
+        stack.append((stmt.get("then_body", []), level))
         return
 
-    kind = expr.get("kind")
+    # Solo se ejecuta una de las ramas: cuenta la que más llamadas hace.
+    # Las ramas se recorren en la misma pila entre marcas que comparten
+    # ``group`` = [llamadas antes del if, llamadas de la rama then].
+    group = [0, 0]
+    stack.extend((
+        (_close_branches, group),
+        (else_body, level),
+        (_next_branch, group),
+        (stmt.get("then_body", []), level),
+        (_open_branches, group),
+    ))
+
+
+def _visit_while(stmt, func_name, facts, level, stack):
+    _scan_expr(stmt.get("cond"), _DIVS, func_name, facts)
+    stack.append((stmt.get("body", []), level + 1))
+
 
-    if kind == "binop":
-        op = expr.get("op")
-        if op in ("/", "div"):
-            right = expr.get("right")
-            if isinstance(right, dict) and right.get("kind") == "num":
-                try:
-                    val = int(right.get("value"))
-                    if val > 1:
-                        divisors.add(val)
-                except Exception:
-                    pass
+def _visit_repeat(stmt, func_name, facts, level, stack):
+    _scan_expr(stmt.get("until"), _DIVS, func_name, facts)
+    stack.append((stmt.get("body", []), level + 1))
 
-        collect_divisors_expr(expr.get("left"), divisors)
-        collect_divisors_expr(expr.get("right"), divisors)
 
-    elif kind == "unop":
-        collect_divisors_expr(expr.get("expr"), divisors)
+def _visit_for(stmt, func_name, facts, level, stack):
+    stack.append((stmt.get("body", []), level + 1))
 
-    elif kind == "index":
-        collect_divisors_expr(expr.get("base"), divisors)
-        collect_divisors_expr(expr.get("index"), divisors)
 
-    elif kind == "funcall":
-        for arg in expr.get("args", []):
-            collect_divisors_expr(arg, divisors)
+def _visit_block(stmt, func_name, facts, level, stack):
+    stack.append((stmt.get("stmts", []), level))
 
 
-def collect_divisors_stmts(stmts: List[Dict[str, Any]], divisors: Set[int]) -> None:
-    """Recopila divisores usados en sentencias.
-    
+# Manejador de cada tipo de sentencia: una búsqueda por nodo en lugar de
+# una cadena de comparaciones if/elif.
+_STMT_HANDLERS = {
+    "call": _visit_call,
+    "assign": _visit_assign,
+    "return": _visit_return,
+    "if": _visit_if,
+    "while": _visit_while,
+    "repeat": _visit_repeat,
+    "for": _visit_for,
+    "block": _visit_block,
+}
+
+
+def analyze_body(body: List[Dict[str, Any]], func_name: str, depth: int = 0) -> BodyFacts:
+    """Recorre una sola vez el cuerpo de una función y recolecta todos sus hechos.
+
     Args:
-        stmts: Lista de sentencias a analizar
-        divisors: Conjunto donde se agregarán los divisores encontrados
+        body: Lista de sentencias a analizar
+        func_name: Nombre de la función recursiva
+        depth: Profundidad de bucles en la que se encuentra ``body``
+
+    Returns:
+        Hechos del cuerpo (llamadas, divisores, bucles, llamadas externas, offsets)
     """
-    for stmt in stmts or []:
-        if not isinstance(stmt, dict):
-            continue
+    facts = BodyFacts(max_loop_depth=depth)
+    stack = deque([(body, depth)])
+    handler_of = _STMT_HANDLERS.get
+    get = dict.get
 
-        kind = stmt.get("kind")
+    while stack:
+        stmts, level = stack.pop()
 
-        if kind == "assign":
-            collect_divisors_expr(stmt.get("expr"), divisors)
+        # Marca de ramas de un if: ajusta el conteo de llamadas
+        if callable(stmts):
+            stmts(facts, level)
+            continue
 
-        elif kind == "call":
-            for arg in stmt.get("args", []):
-                collect_divisors_expr(arg, divisors)
+        facts.max_loop_depth = max(facts.max_loop_depth, level)
 
-        elif kind == "if":
-            collect_divisors_expr(stmt.get("cond"), divisors)
-            collect_divisors_stmts(stmt.get("then_body", []), divisors)
-            else_body = stmt.get("else_body")
-            if else_body:
-                collect_divisors_stmts(else_body, divisors)
+        for stmt in stmts or []:
+            if type(stmt) is not dict:
+                continue
 
-        elif kind in ("while", "repeat", "for"):
-            if kind == "while":
-                collect_divisors_expr(stmt.get("cond"), divisors)
-            elif kind == "repeat":
-                collect_divisors_expr(stmt.get("until"), divisors)
-            collect_divisors_stmts(stmt.get("body", []), divisors)
+            handler = handler_of(get(stmt, "kind"))
+            if handler is not None:
+                handler(stmt, func_name, facts, level, stack)
 
-        elif kind == "block":
-            collect_divisors_stmts(stmt.get("stmts", []), divisors)
+    return facts
 
 
-def extract_all_calls(body: List[Dict[str, Any]], func_name: str) -> List[Tuple[int, int]]:
+def extract_all_calls(
+    body: List[Dict[str, Any]], func_name: str, facts: Optional[BodyFacts] = None
+) -> List[Tuple[int, int]]:
     """Extrae todas las llamadas recursivas y sus parámetros.
-    
+
     Args:
         body: Cuerpo de la función a analizar
         func_name: Nombre de la función recursiva
-        
+        facts: Hechos ya recolectados del cuerpo (se calculan si no se pasan)
+
     Returns:
         Lista de tuplas (a, b) donde a es el número de llamadas y b el divisor
     """
-    a = count_calls_in_stmts(body, func_name)
-
-    divisors: Set[int] = set()
-    collect_divisors_stmts(body, divisors)
+    if facts is None:
+        facts = analyze_body(body, func_name)
 
-    b = min(divisors) if divisors else 1
+    a = facts.recursive_calls
+    b = facts.min_divisor
 
     if a == 0:
         return []
 
-    calls = [(a, b)]
-    return calls
+    return [(a, b)]
 
 
-def count_nested_loops(stmts: List[Dict[str, Any]], depth: int = 0) -> int:
-    """Cuenta la profundidad máxima de bucles anidados.
-    
+def _recursive_offset(expr: Any, func_name: str) -> Optional[int]:
+    """Devuelve k si ``expr`` es una llamada recursiva de la forma f(x - k).
+
     Args:
-        stmts: Lista de sentencias a analizar
-        depth: Profundidad actual
-        
+        expr: Expresión a inspeccionar
+        func_name: Nombre de la función recursiva
+
     Returns:
-        Profundidad máxima de anidamiento
+        El offset k, o None si la expresión no tiene esa forma
     """
-    max_depth = depth
-
-    for stmt in stmts or []:
-        if not isinstance(stmt, dict):
-            continue
+    if not isinstance(expr, dict) or expr.get("kind") != "funcall" or expr.get("name") != func_name:
+        return None
 
-        kind = stmt.get("kind")
+    args = expr.get("args", [])
+    arg = args[0] if args else None
+    if not isinstance(arg, dict) or arg.get("kind") != "binop" or arg.get("op") != "-":
+        return None
 
-        if kind in ("for", "while", "repeat"):
-            body = stmt.get("body", [])
-            nested_depth = count_nested_loops(body, depth + 1)
-            max_depth = max(max_depth, nested_depth)
+    right = arg.get("right")
+    if not isinstance(right, dict) or right.get("kind") != "num":
+        return None
 
-        elif kind == "if":
-            then_depth = count_nested_loops(stmt.get("then_body", []), depth)
-            else_body = stmt.get("else_body")
-            else_depth = count_nested_loops(else_body, depth) if else_body else depth
-            max_depth = max(max_depth, then_depth, else_depth)
+    # Los literales "num" del parser son siempre enteros
+    value = right.get("value")
+    return value if isinstance(value, int) else None
 
-        elif kind == "block":
-            block_depth = count_nested_loops(stmt.get("stmts", []), depth)
-            max_depth = max(max_depth, block_depth)
 
-    return max_depth
+def _matches_fibonacci_shape(body: List[Dict[str, Any]], func_name: str) -> bool:
+    """Reconoce sin recorrer todo el cuerpo la forma de Fibonacci de libro.
 
+    Acepta ``if caso_base then return x else return f(n-1) + f(n-2)`` y la
+    variante sin ``else`` con el retorno recursivo a continuación del ``if``.
+    El caso base solo puede devolver variables o constantes, de modo que el
+    resultado coincide con el del recorrido completo.
 
-def has_external_function_call(stmts: List[Dict[str, Any]], func_name: str) -> bool:
-    """Verifica si hay llamadas a funciones externas (no recursivas).
-    
     Args:
-        stmts: Lista de sentencias a analizar
-        func_name: Nombre de la función recursiva actual
-        
+        body: Cuerpo de la función a analizar
+        func_name: Nombre de la función recursiva
+
     Returns:
-        True si se encuentra una llamada externa
+        True si el cuerpo tiene exactamente esa forma
     """
-    for stmt in stmts or []:
-        if not isinstance(stmt, dict):
-            continue
-
-        kind = stmt.get("kind")
-
-        if kind == "call":
-            if stmt.get("name") != func_name:
-                return True
+    if not body or not isinstance(body[0], dict) or body[0].get("kind") != "if":
+        return False
+
+    guard = body[0]
+    if len(body) == 1:
+        rest = guard.get("else_body") or []
+    elif len(body) == 2 and not guard.get("else_body"):
+        rest = body[1:]
+    else:
+        return False
 
-        elif kind == "assign":
-            expr = stmt.get("expr")
-            if isinstance(expr, dict) and expr.get("kind") == "funcall":
-                if expr.get("name") != func_name:
-                    return True
+    for stmt in guard.get("then_body") or []:
+        if not isinstance(stmt, dict) or stmt.get("kind") not in ("assign", "return"):
+            return False
+        expr = stmt.get("expr")
+        if isinstance(expr, dict) and expr.get("kind") not in ("num", "var"):
+            return False
 
-        elif kind == "if":
-            if has_external_function_call(stmt.get("then_body", []), func_name):
-                return True
-            else_body = stmt.get("else_body")
-            if else_body and has_external_function_call(else_body, func_name):
-                return True
+    if len(rest) != 1 or not isinstance(rest[0], dict) or rest[0].get("kind") not in ("assign", "return"):
+        return False
 
-        elif kind in ("for", "while", "repeat", "block"):
-            body = stmt.get("body", []) if kind != "block" else stmt.get("stmts", [])
-            if has_external_function_call(body, func_name):
-                return True
+    expr = rest[0].get("expr")
+    if not isinstance(expr, dict) or expr.get("kind") != "binop":
+        return False
 
-    return False
+    left = _recursive_offset(expr.get("left"), func_name)
+    right = _recursive_offset(expr.get("right"), func_name)
+    return (left == 1 and right == 2) or (left == 2 and right == 1)
 
 
-def extract_fibonacci_pattern(body: List[Dict[str, Any]], func_name: str) -> Optional[Tuple[int, int, int, int]]:
+def extract_fibonacci_pattern(
+    body: List[Dict[str, Any]], func_name: str, facts: Optional[BodyFacts] = None
+) -> Optional[Tuple[int, int, int, int]]:
     """Detecta si hay un patrón Fibonacci en el código.
-    
+
     Busca dos llamadas recursivas con argumentos n-1 y n-2.
-    
+
     Args:
         body: Cuerpo de la función a analizar
         func_name: Nombre de la función recursiva
-    
+        facts: Hechos ya recolectados del cuerpo (se calculan si no se pasan)
+
     Returns:
         Tupla (a, b, c, d) donde a=1, b=1 para T(n-1) y c=1, d=2 para T(n-2),
         o None si no se detecta el patrón
     """
-    def extract_recursion_args(expr: Dict[str, Any], func_name: str) -> List[int]:
-        """Extrae argumentos de llamadas recursivas como offsets.
-        
-        Args:
-            expr: Expresión a analizar
-            func_name: Nombre de la función recursiva
-            
-        Returns:
-            Lista de offsets (ej: 1 para n-1, 2 para n-2)
-        """
-        if not isinstance(expr, dict):
-            return []
-        
-        kind = expr.get("kind")
-        results = []
-        
-        if kind == "funcall" and expr.get("name") == func_name:
-            # Detectar si el argumento es una expresión binaria como n-1 o n-2
-            args = expr.get("args", [])
-            if args:
-                arg = args[0]
-                if isinstance(arg, dict) and arg.get("kind") == "binop":
-                    op = arg.get("op")
-                    left = arg.get("left")
-                    right = arg.get("right")
-                    
-                    # Buscar patrón: n - constante
-                    if op == "-" and isinstance(right, dict) and right.get("kind") == "num":
-                        try:
-                            offset = int(right.get("value"))
-                            results.append(offset)
-                        except Exception:
-                            pass
-        
-        elif kind == "binop":
-            results.extend(extract_recursion_args(expr.get("left"), func_name))
-            results.extend(extract_recursion_args(expr.get("right"), func_name))
-        
-        elif kind == "unop":
-            results.extend(extract_recursion_args(expr.get("expr"), func_name))
-        
-        elif kind == "funcall":
-            for arg in expr.get("args", []):
-                results.extend(extract_recursion_args(arg, func_name))
-        
-        return results
-    
-    def scan_stmts_for_fibonacci(stmts: List[Dict[str, Any]], func_name: str) -> List[int]:
-        """Recorre sentencias buscando argumentos recursivos.
-        
-        Args:
-            stmts: Lista de sentencias a analizar
-            func_name: Nombre de la función recursiva
-            
-        Returns:
-            Lista de offsets encontrados
-        """
-        offsets = []
-        
-        for stmt in stmts or []:
-            if not isinstance(stmt, dict):
-                continue
-            
-            kind = stmt.get("kind")
-            
-            if kind == "return":
-                expr = stmt.get("expr")
-                if isinstance(expr, dict):
-                    offsets.extend(extract_recursion_args(expr, func_name))
-            
-            elif kind == "assign":
-                offsets.extend(extract_recursion_args(stmt.get("expr"), func_name))
-            
-            elif kind == "if":
-                offsets.extend(scan_stmts_for_fibonacci(stmt.get("then_body", []), func_name))
-                else_body = stmt.get("else_body")
-                if else_body:
-                    offsets.extend(scan_stmts_for_fibonacci(else_body, func_name))
-            
-            elif kind in ("while", "repeat", "for", "block"):
-                body = stmt.get("body", []) if kind != "block" else stmt.get("stmts", [])
-                offsets.extend(scan_stmts_for_fibonacci(body, func_name))
-        
-        return offsets
-    
-    offsets = scan_stmts_for_fibonacci(body, func_name)
-    
-    if len(offsets) == 2 and sorted(offsets) == [1, 2]:
+    if facts is None:
+        if _matches_fibonacci_shape(body, func_name):
+            return (1, 1, 1, 2)
+        facts = analyze_body(body, func_name)
+
+    offsets = facts.fib_offsets
+
+    # Mientras fib_possible sea cierto los offsets solo pueden ser 1 o 2
+    if facts.fib_possible and len(offsets) == 2 and offsets[0] != offsets[1]:
         return (1, 1, 1, 2)  # a=1, b=1, c=1, d=2
-    
+
     return None
 
 
-def estimate_non_recursive_work(body: List[Dict[str, Any]], func_name: str) -> Expr:
+def estimate_non_recursive_work(
+    body: List[Dict[str, Any]], func_name: str, facts: Optional[BodyFacts] = None
+) -> Expr:
     """Estima el trabajo no recursivo (f(n)) de una función recursiva.
-    
+
     Args:
         body: Cuerpo de la función a analizar
         func_name: Nombre de la función recursiva
-        
+        facts: Hechos ya recolectados del cuerpo (se calculan si no se pasan)
+
     Returns:
         Expresión representando la complejidad del trabajo no recursivo
     """
-    loop_depth = count_nested_loops(body)
-    has_external_call = has_external_function_call(body, func_name)
+    if facts is None:
+        facts = analyze_body(body, func_name)
+
+    loop_depth = facts.max_loop_depth
 
-    if has_external_call:
-        result = sym("n")
+    if facts.has_external_call:
+        result = _N
     elif loop_depth >= 3:
-        result = Pow(Sym("n"), 3)
+        result = _N3
     elif loop_depth == 2:
-        result = Pow(Sym("n"), 2)
+        result = _N2
     elif loop_depth == 1:
-        result = sym("n")
+        result = _N
     else:
-        result = const(1)
+        result = _ONE
 
     return result
 
 
 def extract_recurrence(proc: dict, param_name: str = "n") -> Optional[RecurrenceRelation]:
     """Extrae la relación de recurrencia de un procedimiento recursivo.
-    
+
     Args:
         proc: Diccionario representando el procedimiento
         param_name: Nombre del parámetro que representa el tamaño
-        
+
     Returns:
         Objeto RecurrenceRelation o None si no se puede extraer
     """
     func_name = proc.get("name", "")
     body = proc.get("body", [])
 
-    fibonacci_pattern = extract_fibonacci_pattern(body, func_name)
+    # Atajo para la forma de Fibonacci de libro: T(n) = T(n-1) + T(n-2) + c
+    if _matches_fibonacci_shape(body, func_name):
+        rec = RecurrenceRelation(a=1, b=1, c=1, d=2, f_expr=_ONE)
+        rec.equation_text = format_recurrence_equation(rec)
+
+        return rec
+
+    facts = analyze_body(body, func_name)
+
+    fibonacci_pattern = extract_fibonacci_pattern(body, func_name, facts)
     if fibonacci_pattern:
         a, b, c, d = fibonacci_pattern
-        f_expr = estimate_non_recursive_work(body, func_name)
+        f_expr = estimate_non_recursive_work(body, func_name, facts)
         rec = RecurrenceRelation(a=a, b=b, c=c, d=d, f_expr=f_expr)
-        
-        from .equation_formatter import format_recurrence_equation
         rec.equation_text = format_recurrence_equation(rec)
-        
+
         return rec
 
-    calls = extract_all_calls(body, func_name)
+    calls = extract_all_calls(body, func_name, facts)
 
     if not calls:
         return None
 
-    f_expr = estimate_non_recursive_work(body, func_name)
-
-    rec = None
-
-    if len(calls) == 1:
-        a, b = calls[0]
-        if b < 0:
-            b = abs(b)
-        rec = RecurrenceRelation(a=a, b=b, f_expr=f_expr)
-    else:
-        total_a = sum(abs(a) for a, _ in calls)
-        avg_b = abs(calls[0][1])
-        rec = RecurrenceRelation(a=total_a, b=avg_b, f_expr=f_expr)
+    f_expr = estimate_non_recursive_work(body, func_name, facts)
 
-    from .equation_formatter import format_recurrence_equation
+    a, b = calls[0]
+    rec = RecurrenceRelation(a=a, b=b, f_expr=f_expr)
     rec.equation_text = format_recurrence_equation(rec)
 
     return rec
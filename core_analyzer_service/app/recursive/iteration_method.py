@@ -3,6 +3,38 @@ from typing import Optional
 from ..domain import Expr
 
 
+# Texto fijo del desenrollado, unido una sola vez al importar el módulo.
+# Caso típico divide & conquer: T(n) = a T(n/b) + f(n)
+_DC_TEMPLATE = "\n".join([
+    "",
+    "Desenrollando k veces (divide y vencerás):",
+    "T(n) = a·T(n/b) + f(n)",
+    "     = a·[a·T(n/b²) + f(n/b)] + f(n)",
+    "     = a²·T(n/b²) + a·f(n/b) + f(n)",
+    "     = …",
+    "     = aᵏ·T(n/bᵏ) + ∑_{i=0}^{k-1} aⁱ·f(n/bⁱ).",
+    "",
+    "Cuando el tamaño del subproblema es aproximadamente 1,",
+    "n/bᵏ ≈ 1 ⇒ k ≈ log_b(n).",
+    "Sustituyendo k ≈ log_b(n), se obtiene:",
+    "T(n) = a^{log_b(n)}·T(1) + ∑_{i=0}^{log_b(n)-1} aⁱ·f(n/bⁱ).",
+])
+
+# Caso lineal / paso 1 típico: T(n) = T(n-1) + f(n)
+_LINEAR_TEMPLATE = "\n".join([
+    "",
+    "Desenrollando algunas veces (caso lineal típico):",
+    "T(n) = T(n-1) + f(n)",
+    "     = T(n-2) + f(n-1) + f(n)",
+    "     = T(n-3) + f(n-2) + f(n-1) + f(n)",
+    "     = …",
+    "     = T(1) + ∑_{j=2}^{n} f(j).",
+    "",
+    "La complejidad se obtiene estudiando asintóticamente dicha suma",
+    "(por ejemplo, usando fórmulas conocidas para series).",
+])
+
+
 def _format_recurrence(rec) -> str:
     """
     Construye una representación textual sencilla de la recurrencia, del estilo:
@@ -47,47 +79,18 @@ def build_iteration_explanation(rec, solution_expr: Optional[Expr]) -> str:
     (p.ej. teorema maestro o ecuaciones lineales) ya obtuvo una expresión
     asintótica aproximada 'solution_expr', y la usa solo como cierre.
     """
-    lines = []
-
-    recurrence_str = _format_recurrence(rec)
-    lines.append("Método de la iteración aplicado a la recurrencia:")
-    lines.append(recurrence_str)
-
     a = getattr(rec, "a", 0)
     b = getattr(rec, "b", 1)
     c = getattr(rec, "c", 0)
     d = getattr(rec, "d", 0)
 
-    # Caso típico divide & conquer: T(n) = a T(n/b) + f(n)
-    if a and b > 1 and c == 0 and d == 0:
-        lines.append("")
-        lines.append("Desenrollando k veces (divide y vencerás):")
-        lines.append("T(n) = a·T(n/b) + f(n)")
-        lines.append("     = a·[a·T(n/b²) + f(n/b)] + f(n)")
-        lines.append("     = a²·T(n/b²) + a·f(n/b) + f(n)")
-        lines.append("     = …")
-        lines.append("     = aᵏ·T(n/bᵏ) + ∑_{i=0}^{k-1} aⁱ·f(n/bⁱ).")
-        lines.append("")
-        lines.append("Cuando el tamaño del subproblema es aproximadamente 1,")
-        lines.append("n/bᵏ ≈ 1 ⇒ k ≈ log_b(n).")
-        lines.append("Sustituyendo k ≈ log_b(n), se obtiene:")
-        lines.append("T(n) = a^{log_b(n)}·T(1) + ∑_{i=0}^{log_b(n)-1} aⁱ·f(n/bⁱ).")
-    else:
-        # Caso lineal / paso 1 típico: T(n) = T(n-1) + f(n)
-        lines.append("")
-        lines.append("Desenrollando algunas veces (caso lineal típico):")
-        lines.append("T(n) = T(n-1) + f(n)")
-        lines.append("     = T(n-2) + f(n-1) + f(n)")
-        lines.append("     = T(n-3) + f(n-2) + f(n-1) + f(n)")
-        lines.append("     = …")
-        lines.append("     = T(1) + ∑_{j=2}^{n} f(j).")
-        lines.append("")
-        lines.append("La complejidad se obtiene estudiando asintóticamente dicha suma")
-        lines.append("(por ejemplo, usando fórmulas conocidas para series).")
+    template = _DC_TEMPLATE if (a and b > 1 and c == 0 and d == 0) else _LINEAR_TEMPLATE
+    text = f"Método de la iteración aplicado a la recurrencia:\n{_format_recurrence(rec)}\n{template}"
 
     if solution_expr is not None:
-        lines.append("")
-        lines.append(f"En este problema concreto, la suma anterior es Θ({solution_expr}).")
-        lines.append(f"Por tanto, T(n) = Θ({solution_expr}).")
+        text += (
+            f"\n\nEn este problema concreto, la suma anterior es Θ({solution_expr})."
+            f"\nPor tanto, T(n) = Θ({solution_expr})."
+        )
 
-    return "\n".join(lines)
+    return text
@@ -5,6 +5,49 @@ from ..domain import Expr, sym, const, mul, log, Pow, Sym, degree
 from ..domain.recurrence import RecurrenceRelation
 
 
+# Resultados asintóticos frecuentes, construidos una sola vez
+_N = sym("n")
+_N2 = Pow(Sym("n"), 2)
+_LOG_N = log(sym("n"), const(2))
+_N_LOG_N = mul(_N, _LOG_N)
+_TWO_N = sym("2^n")
+
+
+# log_b(a) precalculado para los a, b pequeños que aparecen en la práctica
+_LOG_BA = {
+    (a, b): math.log(a) / math.log(b)
+    for a in range(1, 65)
+    for b in range(2, 65)
+}
+
+
+def log_base(a: int, b: int) -> float:
+    """
+    Devuelve log_b(a), consultando la tabla precalculada cuando es posible.
+    """
+    value = _LOG_BA.get((a, b))
+    if value is None:
+        value = math.log(a) / math.log(b)
+    return value
+
+
+def _exact_log_pow2(a: int, b: int) -> Optional[int]:
+    """
+    log_b(a) exacto cuando a y b son potencias de 2 y el resultado es entero
+    (Merge Sort, búsqueda binaria, ...); None en cualquier otro caso.
+    """
+    if b <= 1 or a <= 0:
+        return None
+    if a & (a - 1) or b & (b - 1):
+        return None
+
+    exp_a = a.bit_length() - 1
+    exp_b = b.bit_length() - 1
+    if exp_a % exp_b:
+        return None
+    return exp_a // exp_b
+
+
 def solve_master_theorem(rec: RecurrenceRelation) -> Tuple[Expr, int, str]:
     a, b = rec.a, rec.b
 
@@ -12,15 +55,17 @@ def solve_master_theorem(rec: RecurrenceRelation) -> Tuple[Expr, int, str]:
         poly_deg, _ = degree(rec.f_expr)
 
         if poly_deg == 0:
-            result = sym("n")
+            result = _N
             explanation = "Recursión lineal: T(n) = T(n-1) + c → Θ(n)"
             return result, 0, explanation
         else:
-            result = Pow(Sym("n"), 2)
+            result = _N2
             explanation = "Recursión lineal con trabajo O(n) → Θ(n²)"
             return result, 0, explanation
 
-    log_b_a = math.log(a) / math.log(b)
+    log_b_a = _exact_log_pow2(a, b)
+    if log_b_a is None:
+        log_b_a = log_base(a, b)
     poly_deg, _ = degree(rec.f_expr)
 
     epsilon = 0.01
@@ -28,11 +73,11 @@ def solve_master_theorem(rec: RecurrenceRelation) -> Tuple[Expr, int, str]:
         exp = round(log_b_a)
         if abs(exp - log_b_a) < 0.01:
             if exp == 1:
-                result = sym("n")
+                result = _N
             else:
                 result = Pow(Sym("n"), exp)
         else:
-            result = sym("n")
+            result = _N
 
         explanation = (
             f"Teorema Maestro Caso 1: f(n)=O(n^{poly_deg}) < n^{log_b_a:.2f} → Θ(n^{exp})"
@@ -42,9 +87,9 @@ def solve_master_theorem(rec: RecurrenceRelation) -> Tuple[Expr, int, str]:
     elif abs(poly_deg - log_b_a) < epsilon:
         exp = round(log_b_a)
         if exp == 1:
-            result = mul(sym("n"), log(sym("n"), const(2)))
+            result = _N_LOG_N
         else:
-            result = mul(Pow(Sym("n"), exp), log(sym("n"), const(2)))
+            result = mul(Pow(Sym("n"), exp), _LOG_N)
 
         explanation = (
             f"Teorema Maestro Caso 2: f(n)=Θ(n^{log_b_a:.2f}) → Θ(n^{exp} log n)"
@@ -65,10 +110,7 @@ def solve_linear_recurrence(rec: RecurrenceRelation) -> Tuple[Optional[Expr], st
     if rec.b != 1:
         return None, ""
 
-    if rec.f_expr is not None:
-        poly_deg, _ = degree(rec.f_expr)
-    else:
-        poly_deg = 0
+    poly_deg, _ = degree(rec.f_expr)
 
     if rec.c == 0:
         a = rec.a
@@ -76,7 +118,7 @@ def solve_linear_recurrence(rec: RecurrenceRelation) -> Tuple[Optional[Expr], st
 
         if k == 0:
             if a == 1:
-                expr = sym("n")
+                expr = _N
                 explanation = (
                     "Recursión lineal de orden 1: T(n) = T(n-1) + Θ(1) ⇒ T(n) = Θ(n)"
                 )
@@ -87,7 +129,7 @@ def solve_linear_recurrence(rec: RecurrenceRelation) -> Tuple[Optional[Expr], st
                     f"⇒ T(n) = Θ({a}^n)"
                 )
             else:
-                expr = sym("n")
+                expr = _N
                 explanation = (
                     "Recursión lineal degenerada (a≤0), asumimos T(n) = Θ(n)"
                 )
@@ -95,7 +137,7 @@ def solve_linear_recurrence(rec: RecurrenceRelation) -> Tuple[Optional[Expr], st
 
         exp = k + 1
         if exp == 1:
-            expr = sym("n")
+            expr = _N
         else:
             expr = Pow(Sym("n"), exp)
 
@@ -112,7 +154,7 @@ def solve_linear_recurrence(rec: RecurrenceRelation) -> Tuple[Optional[Expr], st
         disc = a * a + 4 * c_coef
 
         if disc < 0:
-            expr = sym("2^n")
+            expr = _TWO_N
             explanation = (
                 "Recurrencia lineal de orden 2 con raíces complejas; "
                 "asumimos crecimiento exponencial Θ(2^n)"
@@ -125,7 +167,7 @@ def solve_linear_recurrence(rec: RecurrenceRelation) -> Tuple[Optional[Expr], st
         rho = max(abs(r1), abs(r2))
 
         if a == 1 and c_coef == 1 and poly_deg == 0:
-            expr = sym("2^n")
+            expr = _TWO_N
             explanation = (
                 "Fibonacci ingenuo: T(n) = T(n-1) + T(n-2) + Θ(1) ⇒ "
                 "T(n) = Θ(φ^n) ≈ Θ(2^n)"
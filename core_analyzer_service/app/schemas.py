@@ -5,7 +5,7 @@ incluyendo análisis línea por línea y soporte para iterativo/recursivo.
 """
 
 from typing import List, Optional, Dict, Any, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AnalyzeAstReq(BaseModel):
@@ -17,11 +17,14 @@ class AnalyzeAstReq(BaseModel):
         objective: Qué caso analizar ("worst", "best", "avg", o "all").
         detail: Nivel de detalle ("program" solo global, "line-by-line" incluye cada línea).
         cost_model: Diccionario opcional con costos personalizados para operaciones.
+        strong_bounds_detail: Cuánto de las cotas fuertes construir ("none" las
+            omite, "formula" solo la fórmula, "full" también los términos).
     """
     ast: Dict[str, Any]
     objective: Literal["worst", "best", "avg", "all"] = "all"
     detail: Literal["program", "line-by-line"] = "program"
     cost_model: Optional[Dict[str, Any]] = None
+    strong_bounds_detail: Literal["none", "formula", "full"] = "full"
 
 
 class FunctionMetadata(BaseModel):
@@ -33,6 +36,8 @@ class FunctionMetadata(BaseModel):
         is_recursive: Indica si la función se llama a sí misma (directa o indirectamente).
         calls: Lista de nombres de funciones que esta función llama.
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str
     is_recursive: bool = False
     calls: List[str] = Field(default_factory=list)
@@ -45,9 +50,12 @@ class ProgramMetadata(BaseModel):
     Atributos:
         algorithm_kind: Clasificación del programa según sus funciones.
         functions: Diccionario de metadatos por función.
+        first_recursive_proc: Posición en ast["body"] del primer procedimiento
+            recursivo (None si no hay ninguno).
     """
     algorithm_kind: Literal["iterative", "recursive", "mixed"]
     functions: Dict[str, FunctionMetadata] = Field(default_factory=dict)
+    first_recursive_proc: Optional[int] = None
 
 
 class LineCost(BaseModel):
@@ -63,6 +71,8 @@ class LineCost(BaseModel):
         cost_best: Costo en el mejor caso.
         cost_avg: Costo en el caso promedio (puede ser None si no aplica).
     """
+    model_config = ConfigDict(frozen=True)
+
     line: int
     kind: str
     text: Optional[str] = None
@@ -86,6 +96,8 @@ class TraceStep(BaseModel):
         cost: Costo de este paso
         cumulative_cost: Costo acumulado hasta este paso
     """
+    model_config = ConfigDict(frozen=True)
+
     step: int
     line: int
     kind: str
@@ -110,6 +122,8 @@ class ExecutionTrace(BaseModel):
         complexity_formula: Fórmula de complejidad derivada de la traza
         description: Explicación textual de la traza
     """
+    model_config = ConfigDict(frozen=True)
+
     steps: List[TraceStep]
     total_iterations: int
     max_depth: int
@@ -131,21 +145,26 @@ class StrongBounds(BaseModel):
         dominant_term: Término que domina la complejidad ("5n²")
         constant: Término constante (7)
         evaluated_at: Ejemplos de valores concretos para n pequeños
+
+    Con strong_bounds_detail="formula" solo se calcula ``formula``: terms,
+    dominant_term y constant quedan en None (sin calcular), no vacíos ni 0.
     """
+    model_config = ConfigDict(frozen=True)
+
     formula: str = Field(
         description="Fórmula completa: T(n) = 5n² + 3n + 7"
     )
-    terms: List[Dict[str, Any]] = Field(
-        default_factory=list,
-        description="Lista de términos: [{expr: 'n²', degree: (2,0)}, ...]"
+    terms: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Lista de términos: [{expr: 'n²', degree: (2,0)}, ...] (None si no se calcularon)"
     )
     dominant_term: Optional[str] = Field(
         default=None,
-        description="Término dominante para Big-O"
+        description="Término dominante para Big-O (None si no se calculó o no hay)"
     )
-    constant: int = Field(
-        default=0,
-        description="Término constante aditivo"
+    constant: Optional[int] = Field(
+        default=None,
+        description="Término constante aditivo (None si no se calculó)"
     )
     evaluated_at: Optional[Dict[str, int]] = Field(
         default=None,
@@ -159,6 +178,8 @@ class analyzeAstResp(BaseModel):
     Incluye cotas asintóticas, ecuación de recurrencia (si es recursivo),
     traza de ejecución (si es iterativo), y análisis detallado.
     """
+    model_config = ConfigDict(frozen=True)
+
     algorithm_kind: str
     big_o: str
     big_omega: str
@@ -212,4 +233,19 @@ class AnalysisError(BaseModel):
     """
     severity: Literal["error", "warning"]
     message: str
-    location: Optional[str] = None
\ No newline at end of file
+    location: Optional[str] = None
+
+
+class BatchItemError(BaseModel):
+    """
+    Error de un elemento de /analyze-ast/batch.
+
+    Ocupa la posición del AST que falló, de modo que los demás elementos del
+    lote se devuelven igualmente.
+
+    Atributos:
+        status_code: Código HTTP que habría devuelto /analyze-ast para ese AST.
+        detail: Descripción del error.
+    """
+    status_code: int
+    detail: str
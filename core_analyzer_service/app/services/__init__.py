@@ -1,4 +1,4 @@
 # app/services/__init__.py
-from .combined_analyzer import analyze_ast_core
+from .combined_analyzer import analyze_ast_core, analyze_ast_json
 
-__all__ = ["analyze_ast_core"]
+__all__ = ["analyze_ast_core", "analyze_ast_json"]
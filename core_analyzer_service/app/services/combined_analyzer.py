@@ -9,25 +9,54 @@ Este módulo coordina el análisis de algoritmos mediante:
 
 from __future__ import annotations
 
-from typing import Dict, Any, List
+from threading import Lock
+from typing import Dict, Any, Optional
 
+import orjson
 from fastapi import HTTPException
 
-from ..schemas import AnalyzeAstReq, analyzeAstResp, StrongBounds, LineCost
+from ..schemas import AnalyzeAstReq, analyzeAstResp, StrongBounds
+from ..schemas import ExecutionTrace as ExecutionTraceSchema
 from ..ast_classifier import classify_algorithm
 from ..iterative.api import analyze_iterative_program, serialize_line_costs
 from ..recursive import analyze_recursive_function
 from ..domain.recurrence import RecurrenceRelation, RecursiveAnalysisResult
-from ..domain.summation_builder import analyze_nested_loops, format_summation_equation
 from ..domain.expr import (
     Expr,
+    Add,
+    Const,
+    Pow,
+    Sym,
+    Mul,
     add,
     big_o_str_from_expr,
     big_omega_str_from_expr,
-    to_json,
+    to_explicit_formula,
+    to_json_many,
 )
-from ..domain.summation_builder import analyze_nested_loops, format_summation_equation
+from ..domain.summation_builder import generate_summations_from_expressions
 from ..domain.source_mapper import create_source_mapper
+from ..domain.ast_utils import canonical_json
+
+
+def _mul_degree(term: Mul) -> int:
+    deg = 0
+    for factor in term.factors:
+        factor_kind = type(factor)
+        if factor_kind is Pow:
+            deg += factor.exp
+        elif factor_kind is Sym:
+            deg += 1
+    return deg
+
+
+# Grado polinómico de cada tipo de término que aparece en las cotas fuertes:
+# una búsqueda por término en lugar de una cadena de isinstance. Los nodos del
+# IR no tienen subclases.
+_TERM_DEGREE = {
+    Pow: lambda term: term.exp,
+    Mul: _mul_degree,
+}
 
 
 def _generate_strong_bounds_fixed(expr: Expr, name: str = "T(n)") -> StrongBounds:
@@ -40,51 +69,40 @@ def _generate_strong_bounds_fixed(expr: Expr, name: str = "T(n)") -> StrongBound
     Returns:
         Objeto StrongBounds con fórmula, términos, término dominante y constante
     """
-    from ..domain.expr import to_explicit_formula, Add, Const, Pow, Sym, Mul
-
     formula_str = to_explicit_formula(expr)
 
     terms = []
     dominant_term_str = None
     constant_val = 0
 
-    if isinstance(expr, Add):
+    kind = type(expr)
+    if kind is Add:
         for term in expr.terms:
-            if isinstance(term, Const):
+            term_kind = type(term)
+            if term_kind is Const:
                 constant_val = term.k
-            elif isinstance(term, Pow):
+                continue
+            term_degree = _TERM_DEGREE.get(term_kind)
+            if term_degree is not None:
+                # degree como lista, igual que queda tras pasar por JSON
                 terms.append(
                     {
                         "expr": to_explicit_formula(term),
-                        "degree": (term.exp, 0),
+                        "degree": [term_degree(term), 0],
                     }
                 )
-                if dominant_term_str is None:
-                    dominant_term_str = to_explicit_formula(term)
-            elif isinstance(term, Mul):
-                deg = 0
-                for factor in term.factors:
-                    if isinstance(factor, Pow):
-                        deg += factor.exp
-                    elif isinstance(factor, Sym):
-                        deg += 1
-                terms.append(
-                    {
-                        "expr": to_explicit_formula(term),
-                        "degree": (deg, 0),
-                    }
-                )
-                if dominant_term_str is None:
-                    dominant_term_str = to_explicit_formula(term)
-    elif isinstance(expr, Pow):
+        # El término dominante es el primer Pow/Mul en el orden de la suma
+        if terms:
+            dominant_term_str = terms[0]["expr"]
+    elif kind is Pow:
+        dominant_term_str = to_explicit_formula(expr)
         terms.append(
             {
-                "expr": to_explicit_formula(expr),
-                "degree": (expr.exp, 0),
+                "expr": dominant_term_str,
+                "degree": [expr.exp, 0],
             }
         )
-        dominant_term_str = to_explicit_formula(expr)
-    elif isinstance(expr, Const):
+    elif kind is Const:
         constant_val = expr.k
 
     return StrongBounds(
@@ -95,6 +113,44 @@ def _generate_strong_bounds_fixed(expr: Expr, name: str = "T(n)") -> StrongBound
     )
 
 
+def _strong_bounds(expr: Expr, detail: str) -> Optional[StrongBounds]:
+    """Construye las cotas fuertes solo hasta el nivel de detalle pedido.
+    
+    Args:
+        expr: Expresión de complejidad del peor caso
+        detail: "none", "formula" o "full" (ver AnalyzeAstReq)
+        
+    Returns:
+        Objeto StrongBounds, o None si no se pidieron
+    """
+    if detail == "none":
+        return None
+    if detail == "formula":
+        # terms, dominant_term y constant quedan en None: no se calcularon
+        return StrongBounds(formula=f"T(n) = {to_explicit_formula(expr)}")
+    return _generate_strong_bounds_fixed(expr, name="T(n)")
+
+
+def _ir_to_json(worst: Expr, best: Expr, avg: Optional[Expr] = None):
+    """Serializa el IR de los tres casos sin repetir recorridos.
+
+    Las expresiones iguales al peor caso (o al mejor) se sustituyen por ese
+    mismo objeto, y to_json_many convierte una sola vez cada subárbol
+    compartido.
+
+    Returns:
+        Tupla (ir_worst, ir_best, ir_avg); ir_avg es None si no hay promedio
+    """
+    if best == worst:
+        best = worst
+    if avg is not None:
+        if avg == worst:
+            avg = worst
+        elif avg == best:
+            avg = best
+    return to_json_many(worst, best, avg)
+
+
 def _select_recursive_proc(ast: Dict[str, Any], metadata) -> Dict[str, Any]:
     """Selecciona el primer procedimiento recursivo del AST.
     
@@ -108,18 +164,7 @@ def _select_recursive_proc(ast: Dict[str, Any], metadata) -> Dict[str, Any]:
     Raises:
         HTTPException: Si no se encuentra ningún procedimiento recursivo
     """
-    body: List[Dict[str, Any]] = ast.get("body", [])
-
-    recursive_procs = [
-        item
-        for item in body
-        if isinstance(item, dict)
-        and item.get("kind") == "proc"
-        and metadata.functions.get(item.get("name", ""), None)
-        and metadata.functions[item["name"]].is_recursive
-    ]
-
-    if not recursive_procs:
+    if metadata.first_recursive_proc is None:
         raise HTTPException(
             status_code=500,
             detail=(
@@ -128,7 +173,244 @@ def _select_recursive_proc(ast: Dict[str, Any], metadata) -> Dict[str, Any]:
             ),
         )
 
-    return recursive_procs[0]
+    return ast["body"][metadata.first_recursive_proc]
+
+
+def _analyze_iterative(
+    req: AnalyzeAstReq, ast: Dict[str, Any], metadata, source_mapper
+) -> analyzeAstResp:
+    """Analiza un programa iterativo: sumatorias, costos por línea y traza.
+    
+    Args:
+        req: Solicitud de análisis
+        ast: Árbol de sintaxis abstracta del programa
+        metadata: Metadatos del programa devueltos por classify_algorithm
+        source_mapper: SourceMapper del pseudocódigo, o None si no se envió
+        
+    Returns:
+        Respuesta de análisis
+    """
+    result = analyze_iterative_program(ast)
+
+    big_o = big_o_str_from_expr(result.worst)
+    big_omega = big_omega_str_from_expr(result.best)
+    
+    if big_o == big_omega:
+        theta = big_o
+    elif result.avg is not None:
+        theta = big_o_str_from_expr(result.avg)
+    else:
+        theta = None
+
+    strong_bounds = _strong_bounds(result.worst, req.strong_bounds_detail)
+
+    summations = generate_summations_from_expressions(
+        worst_expr=big_o,
+        best_expr=big_omega,
+        avg_expr=theta if theta else None
+    )
+
+    public_lines = serialize_line_costs(result.lines)
+    if source_mapper:
+        public_lines = source_mapper.annotate_line_costs(public_lines)
+
+    method_used = getattr(result, "method_used", "iteration")
+
+    notes = f"Análisis iterativo. Objetivo: {req.objective}."
+    if getattr(result, "binary_search_detected", False):
+        notes += (
+            " | Patrón detectado: Búsqueda Binaria. "
+            "Peor caso O(log n), mejor caso Ω(1), caso promedio Θ(log n)."
+        )
+    
+    execution_trace_dict = None
+    if hasattr(result, 'execution_trace') and result.execution_trace:
+        # Los dataclasses de la traza tienen los mismos campos que el
+        # esquema: pydantic los lee por atributo, sin diccionarios intermedios.
+        execution_trace_dict = ExecutionTraceSchema.model_validate(
+            result.execution_trace, from_attributes=True
+        )
+    
+    ir_worst, ir_best, ir_avg = _ir_to_json(result.worst, result.best, result.avg)
+
+    return analyzeAstResp(
+        algorithm_kind="iterative",
+        big_o=big_o,
+        big_omega=big_omega,
+        theta=theta,
+        strong_bounds=strong_bounds,
+        ir_worst=ir_worst,
+        ir_best=ir_best,
+        ir_avg=ir_avg,
+        lines=public_lines,
+        notes=notes,
+        method_used=method_used,
+        summations=summations,
+        execution_trace=execution_trace_dict,
+    )
+
+
+def _analyze_recursive(
+    req: AnalyzeAstReq, ast: Dict[str, Any], metadata, source_mapper
+) -> analyzeAstResp:
+    """Analiza el primer procedimiento recursivo mediante su recurrencia.
+    
+    Args:
+        req: Solicitud de análisis
+        ast: Árbol de sintaxis abstracta del programa
+        metadata: Metadatos del programa devueltos por classify_algorithm
+        source_mapper: SourceMapper del pseudocódigo, o None si no se envió
+        
+    Returns:
+        Respuesta de análisis
+    """
+    proc = _select_recursive_proc(ast, metadata)
+    rec_result: RecursiveAnalysisResult = analyze_recursive_function(proc)
+
+    big_o = big_o_str_from_expr(rec_result.big_o)
+    big_omega = big_omega_str_from_expr(rec_result.big_omega)
+    theta = big_o_str_from_expr(rec_result.theta) if rec_result.theta else None
+
+    strong_bounds = _strong_bounds(rec_result.big_o, req.strong_bounds_detail)
+
+    notes = f"Análisis recursivo: {rec_result.explanation}"
+
+    if rec_result.recurrence and rec_result.master_theorem_case:
+        notes += f" | Master Theorem case {rec_result.master_theorem_case}"
+
+    method_used = getattr(rec_result, "method_used", None)
+
+    ir_worst, ir_best, ir_avg = _ir_to_json(
+        rec_result.big_o, rec_result.big_omega, rec_result.theta
+    )
+
+    return analyzeAstResp(
+        algorithm_kind="recursive",
+        big_o=big_o,
+        big_omega=big_omega,
+        theta=theta,
+        strong_bounds=strong_bounds,
+        ir_worst=ir_worst,
+        ir_best=ir_best,
+        ir_avg=ir_avg,
+        lines=None,
+        notes=notes,
+        method_used=method_used,
+        recurrence_equation=rec_result.recurrence_equation,
+    )
+
+
+def _analyze_mixed(
+    req: AnalyzeAstReq, ast: Dict[str, Any], metadata, source_mapper
+) -> analyzeAstResp:
+    """Analiza un programa mixto sumando la parte iterativa y la recursiva.
+    
+    Args:
+        req: Solicitud de análisis
+        ast: Árbol de sintaxis abstracta del programa
+        metadata: Metadatos del programa devueltos por classify_algorithm
+        source_mapper: SourceMapper del pseudocódigo, o None si no se envió
+        
+    Returns:
+        Respuesta de análisis
+    """
+    iter_result = analyze_iterative_program(ast)
+    proc = _select_recursive_proc(ast, metadata)
+    rec_result: RecursiveAnalysisResult = analyze_recursive_function(proc)
+
+    total_worst_expr = add(iter_result.worst, rec_result.big_o)
+    total_best_expr = add(iter_result.best, rec_result.big_omega)
+
+    big_o = big_o_str_from_expr(total_worst_expr)
+    big_omega = big_omega_str_from_expr(total_best_expr)
+    theta = big_o if big_o == big_omega else None
+
+    strong_bounds = _strong_bounds(total_worst_expr, req.strong_bounds_detail)
+
+    iter_worst_str = big_o_str_from_expr(iter_result.worst)
+    iter_best_str = big_omega_str_from_expr(iter_result.best)
+    rec_worst_str = big_o_str_from_expr(rec_result.big_o)
+    rec_best_str = big_omega_str_from_expr(rec_result.big_omega)
+
+    notes = [
+        "Análisis mixto (iterativo + recursivo).",
+        f"Parte iterativa: peor {iter_worst_str}, mejor {iter_best_str}.",
+        f"Parte recursiva: peor {rec_worst_str}, mejor {rec_best_str}.",
+    ]
+
+    if rec_result.recurrence:
+        rec: RecurrenceRelation = rec_result.recurrence
+        notes.append(
+            f"Recurrencia detectada en parte recursiva: "
+            f"T(n) = {rec.a}T(n/{rec.b}) + f(n)"
+        )
+        if rec_result.master_theorem_case:
+            notes.append(
+                f"Teorema Maestro (parte recursiva) caso {rec_result.master_theorem_case}"
+            )
+
+    public_lines = serialize_line_costs(iter_result.lines)
+    if source_mapper:
+        public_lines = source_mapper.annotate_line_costs(public_lines)
+
+    iter_method = getattr(iter_result, "method_used", "iteration")
+    rec_method = getattr(rec_result, "method_used", None)
+    if rec_method:
+        method_used = f"mixed({iter_method} + {rec_method})"
+    else:
+        method_used = f"mixed({iter_method} + recursive_core)"
+
+    ir_worst, ir_best, _ = _ir_to_json(total_worst_expr, total_best_expr)
+
+    return analyzeAstResp(
+        algorithm_kind="mixed",
+        big_o=big_o,
+        big_omega=big_omega,
+        theta=theta,
+        strong_bounds=strong_bounds,
+        ir_worst=ir_worst,
+        ir_best=ir_best,
+        ir_avg=None,
+        lines=public_lines,
+        notes=" | ".join(notes),
+        method_used=method_used,
+    )
+
+
+# Rama de análisis según la clasificación del programa
+_KIND_HANDLERS = {
+    "iterative": _analyze_iterative,
+    "recursive": _analyze_recursive,
+    "mixed": _analyze_mixed,
+}
+
+
+# Respuestas ya calculadas, por petición completa (AST, objetivo, detalle,
+# modelo de costos y nivel de cotas fuertes), guardadas como el JSON que
+# devuelve la API. Es la única caché del análisis: las capas internas trabajan
+# directamente sobre el AST ya parseado.
+_RESPONSE_CACHE: Dict[bytes, bytes] = {}
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE_LOCK = Lock()
+
+
+def _remember_response(key: bytes, resp: analyzeAstResp) -> bytes:
+    """Serializa la respuesta y la guarda en la caché.
+    
+    Args:
+        key: Clave de la petición (ver analyze_ast_core)
+        resp: Respuesta recién calculada
+        
+    Returns:
+        La respuesta serializada en JSON
+    """
+    resp_json = orjson.dumps(resp.model_dump(), option=orjson.OPT_NON_STR_KEYS)
+    with _RESPONSE_CACHE_LOCK:
+        if len(_RESPONSE_CACHE) >= _RESPONSE_CACHE_SIZE:
+            # Los dict conservan el orden de inserción: sale la más antigua
+            del _RESPONSE_CACHE[next(iter(_RESPONSE_CACHE))]
+        _RESPONSE_CACHE[key] = resp_json
+    return resp_json
 
 
 def analyze_ast_core(req: AnalyzeAstReq) -> analyzeAstResp:
@@ -140,187 +422,64 @@ def analyze_ast_core(req: AnalyzeAstReq) -> analyzeAstResp:
     - Proporciona cotas fuertes sin expresiones redundantes
     - Retorna datos de sumatorias para visualización en UI
     
+    La respuesta se memoiza por la petición completa, de modo que reenviar
+    la misma petición no repite el análisis. La caché guarda la respuesta
+    serializada: cada llamada recibe un modelo propio que puede modificar
+    sin alterar a las demás.
+    
     Args:
         req: Solicitud de análisis conteniendo AST y modelo de costos
         
     Returns:
         Respuesta de análisis con cotas de complejidad e información detallada
     """
-    ast = req.ast
+    key = canonical_json(dict(req))
 
-    pseudocode_source = req.cost_model.get("source_code") if req.cost_model else None
-    source_mapper = create_source_mapper(pseudocode_source) if pseudocode_source else None
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return analyzeAstResp.model_validate_json(cached)
 
-    metadata = classify_algorithm(ast)
+    resp = _analyze_request(req)
+    _remember_response(key, resp)
+    return resp
 
-    if metadata.algorithm_kind == "iterative":
-        result = analyze_iterative_program(ast)
 
-        big_o = big_o_str_from_expr(result.worst)
-        big_omega = big_omega_str_from_expr(result.best)
+def analyze_ast_json(req: AnalyzeAstReq) -> bytes:
+    """Como analyze_ast_core, pero devuelve la respuesta ya serializada en JSON.
+    
+    Es lo que usan los endpoints: en un acierto de caché se devuelven los
+    bytes guardados sin reconstruir el modelo, y en un fallo la serialización
+    para la caché es la misma que se envía al cliente.
+    
+    Args:
+        req: Solicitud de análisis conteniendo AST y modelo de costos
         
-        if big_o == big_omega:
-            theta = big_o
-        elif result.avg is not None:
-            theta = big_o_str_from_expr(result.avg)
-        else:
-            theta = None
+    Returns:
+        Respuesta de análisis serializada en JSON
+    """
+    key = canonical_json(dict(req))
 
-        strong_bounds = _generate_strong_bounds_fixed(result.worst, name="T(n)")
+    cached = _RESPONSE_CACHE.get(key)
+    if cached is not None:
+        return cached
 
-        from ..domain.summation_builder import generate_summations_from_expressions
-        
-        summations = generate_summations_from_expressions(
-            worst_expr=big_o,
-            best_expr=big_omega,
-            avg_expr=theta if theta else None
-        )
-
-        public_lines = serialize_line_costs(result.lines)
-        if source_mapper:
-            lines_as_dicts = [lc.model_dump() for lc in public_lines]
-            lines_as_dicts = source_mapper.annotate_line_costs(lines_as_dicts)
-            public_lines = [LineCost(**lc_dict) for lc_dict in lines_as_dicts]
+    return _remember_response(key, _analyze_request(req))
 
-        method_used = getattr(result, "method_used", "iteration")
 
-        notes_list = [f"Análisis iterativo. Objetivo: {req.objective}."]
-        if getattr(result, "binary_search_detected", False):
-            notes_list.append(
-                "Patrón detectado: Búsqueda Binaria. "
-                "Peor caso O(log n), mejor caso Ω(1), caso promedio Θ(log n)."
-            )
-        
-        execution_trace_dict = None
-        if hasattr(result, 'execution_trace') and result.execution_trace:
-            from ..schemas import ExecutionTrace as ExecutionTraceSchema
-            trace = result.execution_trace
-            execution_trace_dict = ExecutionTraceSchema(
-                steps=[{
-                    "step": step.step,
-                    "line": step.line,
-                    "kind": step.kind,
-                    "condition": step.condition,
-                    "variables": step.variables,
-                    "operation": step.operation,
-                    "cost": step.cost,
-                    "cumulative_cost": step.cumulative_cost
-                } for step in trace.steps],
-                total_iterations=trace.total_iterations,
-                max_depth=trace.max_depth,
-                variables_tracked=trace.variables_tracked,
-                complexity_formula=trace.complexity_formula,
-                description=trace.description
-            )
+def _analyze_request(req: AnalyzeAstReq) -> analyzeAstResp:
+    """Ejecuta el análisis de una petición (solo en fallos de caché).
+    
+    Args:
+        req: Solicitud de análisis
         
-        return analyzeAstResp(
-            algorithm_kind="iterative",
-            big_o=big_o,
-            big_omega=big_omega,
-            theta=theta,
-            strong_bounds=strong_bounds,
-            ir_worst=to_json(result.worst),
-            ir_best=to_json(result.best),
-            ir_avg=to_json(result.avg) if result.avg else None,
-            lines=public_lines,
-            notes=" | ".join(notes_list),
-            method_used=method_used,
-            summations=summations,
-            execution_trace=execution_trace_dict,
-        )
-
-    if metadata.algorithm_kind == "recursive":
-        proc = _select_recursive_proc(ast, metadata)
-        rec_result: RecursiveAnalysisResult = analyze_recursive_function(proc)
-
-        big_o = big_o_str_from_expr(rec_result.big_o)
-        big_omega = big_omega_str_from_expr(rec_result.big_omega)
-        theta = big_o_str_from_expr(rec_result.theta) if rec_result.theta else None
-
-        strong_bounds = _generate_strong_bounds_fixed(rec_result.big_o, name="T(n)")
-
-        notes = [f"Análisis recursivo: {rec_result.explanation}"]
-
-        if rec_result.recurrence:
-            rec: RecurrenceRelation = rec_result.recurrence
-            if rec_result.master_theorem_case:
-                notes.append(f"Master Theorem case {rec_result.master_theorem_case}")
-
-        method_used = getattr(rec_result, "method_used", None)
-
-        return analyzeAstResp(
-            algorithm_kind="recursive",
-            big_o=big_o,
-            big_omega=big_omega,
-            theta=theta,
-            strong_bounds=strong_bounds,
-            ir_worst=to_json(rec_result.big_o),
-            ir_best=to_json(rec_result.big_omega),
-            ir_avg=to_json(rec_result.theta) if rec_result.theta else None,
-            lines=None,
-            notes=" | ".join(notes),
-            method_used=method_used,
-            recurrence_equation=rec_result.recurrence_equation,
-        )
-
-    if metadata.algorithm_kind == "mixed":
-        iter_result = analyze_iterative_program(ast)
-        proc = _select_recursive_proc(ast, metadata)
-        rec_result: RecursiveAnalysisResult = analyze_recursive_function(proc)
-
-        total_worst_expr = add(iter_result.worst, rec_result.big_o)
-        total_best_expr = add(iter_result.best, rec_result.big_omega)
-
-        big_o = big_o_str_from_expr(total_worst_expr)
-        big_omega = big_omega_str_from_expr(total_best_expr)
-        theta = big_o if big_o == big_omega else None
-
-        strong_bounds = _generate_strong_bounds_fixed(total_worst_expr, name="T(n)")
+    Returns:
+        Respuesta de análisis
+    """
+    ast = req.ast
 
-        notes = ["Análisis mixto (iterativo + recursivo)."]
-        notes.append(
-            f"Parte iterativa: peor {big_o_str_from_expr(iter_result.worst)}, "
-            f"mejor {big_omega_str_from_expr(iter_result.best)}."
-        )
-        notes.append(
-            f"Parte recursiva: peor {big_o_str_from_expr(rec_result.big_o)}, "
-            f"mejor {big_omega_str_from_expr(rec_result.big_omega)}."
-        )
+    pseudocode_source = req.cost_model.get("source_code") if req.cost_model else None
+    source_mapper = create_source_mapper(pseudocode_source) if pseudocode_source else None
 
-        if rec_result.recurrence:
-            rec: RecurrenceRelation = rec_result.recurrence
-            notes.append(
-                f"Recurrencia detectada en parte recursiva: "
-                f"T(n) = {rec.a}T(n/{rec.b}) + f(n)"
-            )
-            if rec_result.master_theorem_case:
-                notes.append(
-                    f"Teorema Maestro (parte recursiva) caso {rec_result.master_theorem_case}"
-                )
+    metadata = classify_algorithm(ast)
 
-        public_lines = serialize_line_costs(iter_result.lines)
-        if source_mapper:
-            lines_as_dicts = [lc.model_dump() for lc in public_lines]
-            lines_as_dicts = source_mapper.annotate_line_costs(lines_as_dicts)
-            public_lines = [LineCost(**lc_dict) for lc_dict in lines_as_dicts]
-
-        iter_method = getattr(iter_result, "method_used", "iteration")
-        rec_method = getattr(rec_result, "method_used", None)
-        if rec_method:
-            method_used = f"mixed({iter_method} + {rec_method})"
-        else:
-            method_used = f"mixed({iter_method} + recursive_core)"
-
-        return analyzeAstResp(
-            algorithm_kind="mixed",
-            big_o=big_o,
-            big_omega=big_omega,
-            theta=theta,
-            strong_bounds=strong_bounds,
-            ir_worst=to_json(total_worst_expr),
-            ir_best=to_json(total_best_expr),
-            ir_avg=None,
-            lines=public_lines,
-            notes=" | ".join(notes),
-            method_used=method_used,
-        )
+    return _KIND_HANDLERS[metadata.algorithm_kind](req, ast, metadata, source_mapper)
@@ -0,0 +1,43 @@
+"""
+Constructores de nodos del AST para los tests
+=============================================
+
+Generan los diccionarios con la misma forma que produce el parser.
+"""
+
+
+def num(v):
+    return {"kind": "num", "value": v}
+
+
+def var(name):
+    return {"kind": "var", "name": name}
+
+
+def call(name, *args):
+    return {"kind": "call", "name": name, "args": list(args)}
+
+
+def funcall(name, *args):
+    return {"kind": "funcall", "name": name, "args": list(args)}
+
+
+def binop(op, left, right):
+    return {"kind": "binop", "op": op, "left": left, "right": right}
+
+
+def assign(name, expr):
+    return {"kind": "assign", "target": var(name), "expr": expr}
+
+
+def for_loop(loop_var, body):
+    """for loop_var <- 1 to n do body"""
+    return {"kind": "for", "var": loop_var, "start": num(1), "end": var("n"), "body": body}
+
+
+def proc(name, body):
+    return {"kind": "proc", "name": name, "body": body}
+
+
+def program(*items):
+    return {"kind": "program", "body": list(items)}
@@ -0,0 +1,89 @@
+"""
+Test de los endpoints del analizador
+====================================
+
+Ejercita las rutas con TestClient, sin levantar el servicio.
+"""
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.api.analyzer_routes import _MAX_BATCH_SIZE
+from app.schemas import AnalyzeAstReq
+from app.services import analyze_ast_core, analyze_ast_json
+from tests._ast_helpers import num, assign, for_loop, program
+
+
+LINEAR_AST = program(for_loop("i", [assign("x", num(1))]))
+# El cuerpo del for no es una lista de sentencias: el análisis falla
+BROKEN_AST = program(for_loop("i", "x"))
+
+
+@pytest.fixture(scope="module")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+def test_analyze_ast_serves_orjson_body(client):
+    """/analyze-ast devuelve tal cual el JSON que produce el servicio"""
+    r = client.post("/analyze-ast", json={"ast": LINEAR_AST})
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.content == analyze_ast_json(AnalyzeAstReq(ast=LINEAR_AST))
+    assert r.json() == orjson.loads(orjson.dumps(analyze_ast_core(AnalyzeAstReq(ast=LINEAR_AST)).model_dump()))
+
+
+def test_analyze_ast_error(client):
+    """Un fallo del análisis se devuelve como error HTTP con su detalle"""
+    r = client.post("/analyze-ast", json={"ast": BROKEN_AST})
+
+    assert r.status_code == 500
+    assert r.json()["detail"].startswith("Internal analysis error")
+
+
+def test_health(client):
+    """/health sirve su cuerpo precalculado"""
+    r = client.get("/health")
+
+    assert r.status_code == 200
+    assert r.headers["content-type"] == "application/json"
+    assert r.content == b'{"status":"ok","service":"core_analyzer"}'
+
+
+def test_batch_success(client):
+    """Cada AST del lote recibe su análisis, en el mismo orden"""
+    r = client.post("/analyze-ast/batch", json=[{"ast": LINEAR_AST}, {"ast": LINEAR_AST}])
+
+    assert r.status_code == 200
+    items = r.json()
+    assert [item["big_o"] for item in items] == ["n", "n"]
+    assert items[0] == client.post("/analyze-ast", json={"ast": LINEAR_AST}).json()
+
+
+def test_batch_item_error(client):
+    """Un AST que falla deja su error en su posición sin tumbar el lote"""
+    r = client.post(
+        "/analyze-ast/batch",
+        json=[{"ast": LINEAR_AST}, {"ast": BROKEN_AST}, {"ast": LINEAR_AST}],
+    )
+
+    assert r.status_code == 200
+    first, failed, last = r.json()
+    assert first["big_o"] == last["big_o"] == "n"
+    assert failed["status_code"] == 500
+    assert failed["detail"].startswith("Internal analysis error")
+
+
+def test_batch_too_large(client):
+    """Los lotes por encima del máximo se rechazan sin analizarse"""
+    r = client.post("/analyze-ast/batch", json=[{"ast": LINEAR_AST}] * (_MAX_BATCH_SIZE + 1))
+
+    assert r.status_code == 413
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
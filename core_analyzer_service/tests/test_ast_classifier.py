@@ -0,0 +1,51 @@
+"""
+Test del clasificador de algoritmos
+===================================
+
+Verifica la clasificación iterativo/recursivo/mixto y la posición del primer
+procedimiento recursivo que se guarda en los metadatos.
+"""
+
+import pytest
+from app.ast_classifier import classify_algorithm
+from tests._ast_helpers import num, call, assign, proc, program
+
+
+def _proc(name, *callees):
+    return proc(name, [call(callee) for callee in callees])
+
+
+def test_no_recursive_procs():
+    """Sin recursión no hay primer procedimiento recursivo"""
+    meta = classify_algorithm(program(_proc("A", "B"), _proc("B")))
+
+    assert meta.algorithm_kind == "iterative"
+    assert meta.first_recursive_proc is None
+
+
+def test_one_recursive_proc():
+    """Se guarda la posición en body del único procedimiento recursivo"""
+    meta = classify_algorithm(program(_proc("A"), _proc("F", "F")))
+
+    assert meta.algorithm_kind == "mixed"
+    assert meta.first_recursive_proc == 1
+    assert meta.functions["F"].is_recursive
+
+
+def test_several_recursive_procs():
+    """Con varios procedimientos recursivos se guarda el primero en body"""
+    meta = classify_algorithm(program(_proc("A"), _proc("G", "G"), _proc("F", "F")))
+
+    assert meta.first_recursive_proc == 1
+
+
+def test_first_recursive_proc_skips_non_proc_items():
+    """La posición cuenta también las sentencias sueltas de body"""
+    meta = classify_algorithm(program(assign("x", num(1)), _proc("F", "F")))
+
+    assert meta.algorithm_kind == "recursive"
+    assert meta.first_recursive_proc == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
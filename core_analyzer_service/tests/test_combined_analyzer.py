@@ -0,0 +1,119 @@
+"""
+Test del servicio de análisis combinado
+=======================================
+
+Verifica los niveles de detalle de las cotas fuertes que construye
+analyze_ast_core y la caché de respuestas por petición.
+"""
+
+import orjson
+import pytest
+from app.schemas import AnalyzeAstReq
+from app.services import analyze_ast_core, analyze_ast_json
+from app.services import combined_analyzer
+from tests._ast_helpers import num, assign, for_loop, program
+
+
+# x <- 1; for i <- 1 to n: for j <- 1 to n: x <- 1   →   T(n) = n² + 1
+NESTED_LOOPS_AST = program(
+    assign("x", num(1)), for_loop("i", [for_loop("j", [assign("x", num(1))])])
+)
+
+
+def _strong_bounds(detail):
+    return analyze_ast_core(
+        AnalyzeAstReq(ast=NESTED_LOOPS_AST, strong_bounds_detail=detail)
+    ).strong_bounds
+
+
+def test_strong_bounds_none():
+    """Con "none" no se construyen cotas fuertes"""
+    assert _strong_bounds("none") is None
+
+
+def test_strong_bounds_formula():
+    """Con "formula" solo se calcula la fórmula; el resto queda sin calcular"""
+    bounds = _strong_bounds("formula")
+
+    assert bounds.formula == "T(n) = n² + 1"
+    assert bounds.terms is None
+    assert bounds.dominant_term is None
+    assert bounds.constant is None
+
+
+def test_strong_bounds_full():
+    """Con "full" (por defecto) se calculan términos, dominante y constante"""
+    bounds = _strong_bounds("full")
+
+    assert bounds.formula == "T(n) = n² + 1"
+    assert bounds.terms == [{"expr": "n²", "degree": [2, 0]}]
+    assert bounds.dominant_term == "n²"
+    assert bounds.constant == 1
+    assert analyze_ast_core(AnalyzeAstReq(ast=NESTED_LOOPS_AST)).strong_bounds == bounds
+
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(combined_analyzer, "_RESPONSE_CACHE", {})
+    return combined_analyzer._RESPONSE_CACHE
+
+
+def test_cache_hit_matches_miss(empty_cache):
+    """Repetir la petición devuelve la misma respuesta desde la caché"""
+    req = AnalyzeAstReq(ast=NESTED_LOOPS_AST)
+    first = analyze_ast_core(req)
+    second = analyze_ast_core(AnalyzeAstReq(ast=NESTED_LOOPS_AST))
+
+    assert len(empty_cache) == 1
+    assert second == first
+    assert second is not first
+
+
+def test_cache_hit_is_independent(empty_cache):
+    """Modificar una respuesta no altera las que se sirven después"""
+    req = AnalyzeAstReq(ast=NESTED_LOOPS_AST)
+    first = analyze_ast_core(req)
+    expected = first.model_copy(deep=True)
+
+    first.lines.clear()
+    first.strong_bounds.terms.clear()
+    hit = analyze_ast_core(req)
+    hit.ir_worst.clear()
+
+    assert analyze_ast_core(req) == expected
+
+
+def test_cache_key_includes_request_options(empty_cache):
+    """Peticiones con el mismo AST pero otras opciones no comparten entrada"""
+    full = analyze_ast_core(AnalyzeAstReq(ast=NESTED_LOOPS_AST))
+    formula = analyze_ast_core(AnalyzeAstReq(ast=NESTED_LOOPS_AST, strong_bounds_detail="formula"))
+
+    assert len(empty_cache) == 2
+    assert full.strong_bounds != formula.strong_bounds
+
+
+def test_analyze_ast_json_matches_model(empty_cache):
+    """El JSON servido a los endpoints es la serialización de la respuesta"""
+    req = AnalyzeAstReq(ast=NESTED_LOOPS_AST)
+    body = analyze_ast_json(req)
+
+    assert orjson.loads(body) == orjson.loads(orjson.dumps(analyze_ast_core(req).model_dump()))
+    assert analyze_ast_json(req) is body
+
+
+def test_cache_evicts_oldest(empty_cache, monkeypatch):
+    """La caché no crece por encima de su tamaño; sale la entrada más antigua"""
+    monkeypatch.setattr(combined_analyzer, "_RESPONSE_CACHE_SIZE", 2)
+    reqs = [
+        AnalyzeAstReq(ast=NESTED_LOOPS_AST, strong_bounds_detail=detail)
+        for detail in ("none", "formula", "full")
+    ]
+    for req in reqs:
+        analyze_ast_json(req)
+
+    assert len(empty_cache) == 2
+    assert combined_analyzer.canonical_json(dict(reqs[0])) not in empty_cache
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
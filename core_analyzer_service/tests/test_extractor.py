@@ -0,0 +1,146 @@
+"""
+Test del extractor de recurrencias
+==================================
+
+Verifica los hechos que recolecta el recorrido único del cuerpo de una
+función recursiva y la recurrencia que se deriva de ellos.
+"""
+
+import pytest
+from app.recursive.extractor import analyze_body, extract_recurrence
+from app.domain.expr import sym, const
+from tests._ast_helpers import num, var, call, funcall, binop, assign, for_loop
+
+
+MERGE_SORT_BODY = [
+    {
+        "kind": "if",
+        "cond": binop("<", var("p"), var("r")),
+        "then_body": [
+            assign("q", binop("/", binop("+", var("p"), var("r")), num(2))),
+            call("MERGE_SORT", var("A"), var("p"), var("q")),
+            call("MERGE_SORT", var("A"), binop("+", var("q"), num(1)), var("r")),
+            call("MERGE", var("A"), var("p"), var("q"), var("r")),
+        ],
+    }
+]
+
+FIBONACCI_BODY = [
+    {
+        "kind": "if",
+        "cond": binop("<=", var("n"), num(1)),
+        "then_body": [assign("_return", var("n"))],
+        "else_body": [
+            assign(
+                "_return",
+                binop(
+                    "+",
+                    funcall("FIB", binop("-", var("n"), num(1))),
+                    funcall("FIB", binop("-", var("n"), num(2))),
+                ),
+            )
+        ],
+    }
+]
+
+
+def test_merge_sort_facts():
+    """Merge Sort: 2 llamadas, divisor 2 y una llamada externa a MERGE"""
+    facts = analyze_body(MERGE_SORT_BODY, "MERGE_SORT")
+
+    assert facts.recursive_calls == 2
+    assert facts.min_divisor == 2
+    assert facts.max_loop_depth == 0
+    assert facts.has_external_call
+
+
+def test_fibonacci_facts():
+    """Fibonacci: offsets n-1 y n-2 dentro de la rama else"""
+    facts = analyze_body(FIBONACCI_BODY, "FIB")
+
+    assert sorted(facts.fib_offsets) == [1, 2]
+    assert not facts.has_external_call
+
+
+def test_unexpected_offset_rules_out_fibonacci():
+    """Un offset distinto de 1 o 2 descarta Fibonacci y deja de acumular offsets"""
+    body = [
+        assign("_return", binop("+", funcall("F", binop("-", var("n"), num(3))),
+                                  funcall("F", binop("-", var("n"), num(1))))),
+        assign("x", funcall("F", binop("-", var("n"), num(2)))),
+    ]
+    facts = analyze_body(body, "F")
+
+    assert not facts.fib_possible
+    assert 2 not in facts.fib_offsets
+
+
+def test_if_counts_branch_with_most_calls():
+    """En un if solo cuenta la rama con más llamadas recursivas"""
+    body = [
+        {
+            "kind": "if",
+            "cond": binop(">", var("n"), num(1)),
+            "then_body": [call("F", binop("/", var("n"), num(3)))] * 3,
+            "else_body": [call("F", binop("/", var("n"), num(2)))],
+        }
+    ]
+    facts = analyze_body(body, "F")
+
+    assert facts.recursive_calls == 3
+    assert facts.min_divisor == 2
+
+
+def test_nested_loops_depth():
+    """La profundidad de bucles cuenta for/while/repeat anidados"""
+    inner = {"kind": "while", "cond": var("x"), "body": [assign("x", num(0))]}
+    outer = for_loop("i", [inner])
+    facts = analyze_body([outer, call("F", binop("-", var("n"), num(1)))], "F")
+
+    assert facts.max_loop_depth == 2
+    assert facts.recursive_calls == 1
+
+
+def test_extract_recurrence_merge_sort():
+    """Merge Sort genera T(n) = 2·T(n/2) + c·n"""
+    rec = extract_recurrence({"kind": "proc", "name": "MERGE_SORT", "body": MERGE_SORT_BODY})
+
+    assert (rec.a, rec.b, rec.c, rec.d) == (2, 2, 0, 0)
+    assert rec.f_expr == sym("n")
+
+
+def test_extract_recurrence_fibonacci():
+    """Fibonacci genera T(n) = T(n-1) + T(n-2) + c"""
+    rec = extract_recurrence({"kind": "proc", "name": "FIB", "body": FIBONACCI_BODY})
+
+    assert (rec.a, rec.b, rec.c, rec.d) == (1, 1, 1, 2)
+    assert rec.f_expr == const(1)
+
+
+def test_extract_recurrence_independent_results():
+    """Cuerpos idénticos devuelven recurrencias independientes"""
+    proc = {"kind": "proc", "name": "MERGE_SORT", "body": MERGE_SORT_BODY}
+    first = extract_recurrence(proc)
+    first.a = 99
+    second = extract_recurrence(dict(proc))
+
+    assert second.a == 2
+    assert second is not first
+
+
+def test_fibonacci_shape_without_else():
+    """La forma sin else (retorno recursivo tras el if) también es Fibonacci"""
+    guard = dict(FIBONACCI_BODY[0])
+    ret = guard.pop("else_body")[0]
+    rec = extract_recurrence({"kind": "proc", "name": "FIB", "body": [guard, ret]})
+
+    assert (rec.a, rec.b, rec.c, rec.d) == (1, 1, 1, 2)
+
+
+def test_extract_recurrence_without_calls():
+    """Sin llamadas recursivas no hay recurrencia"""
+    assert extract_recurrence({"kind": "proc", "name": "F", "body": [assign("x", num(1))]}) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
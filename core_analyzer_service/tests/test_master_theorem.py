@@ -0,0 +1,54 @@
+"""
+Test del Teorema Maestro
+========================
+
+Verifica los casos con a y b potencias de dos y las entradas inválidas.
+"""
+
+import pytest
+from app.recursive.master_theorem import solve_master_theorem, _exact_log_pow2
+from app.domain.recurrence import RecurrenceRelation
+from app.domain.expr import sym, const, big_o_str_from_expr
+
+
+def test_merge_sort_case_2():
+    """Merge Sort: T(n) = 2·T(n/2) + n → Caso 2, Θ(n log n)"""
+    result, case, _ = solve_master_theorem(RecurrenceRelation(a=2, b=2, f_expr=sym("n")))
+
+    assert case == 2
+    assert big_o_str_from_expr(result) == "n log n"
+
+
+def test_binary_search_case_2():
+    """Búsqueda binaria: T(n) = T(n/2) + c → Caso 2, Θ(log n)"""
+    _, case, explanation = solve_master_theorem(RecurrenceRelation(a=1, b=2, f_expr=const(1)))
+
+    assert case == 2
+    assert "n^0.00" in explanation
+
+
+def test_power_of_two_non_integer_exponent():
+    """T(n) = 2·T(n/4) + c tiene log_b(a) = 0.5, no entero"""
+    _, case, explanation = solve_master_theorem(RecurrenceRelation(a=2, b=4, f_expr=const(1)))
+
+    assert case == 1
+    assert "n^0.50" in explanation
+
+
+@pytest.mark.parametrize(
+    "a, b, expected",
+    [(2, 2, 1), (1, 2, 0), (8, 2, 3), (16, 4, 2), (2, 4, None), (3, 2, None), (4, 3, None), (1, 0, None), (0, 2, None)],
+)
+def test_exact_log_pow2(a, b, expected):
+    """log_b(a) exacto solo para potencias de 2 con exponente entero"""
+    assert _exact_log_pow2(a, b) == expected
+
+
+def test_invalid_base_is_rejected():
+    """b = 0 no es una división válida del problema"""
+    with pytest.raises(ValueError):
+        solve_master_theorem(RecurrenceRelation(a=1, b=0, f_expr=const(1)))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,37 @@
+"""
+Test del analizador recursivo
+=============================
+
+Verifica el análisis por casos de QuickSort.
+"""
+
+import pytest
+from app.recursive import analyze_recursive_function
+from app.domain.expr import big_o_str_from_expr
+
+
+def test_quicksort_case_based_analysis():
+    """QuickSort: peor caso Θ(n²), mejor/promedio Θ(n log n)"""
+    result = analyze_recursive_function({"kind": "proc", "name": "QuickSort", "body": []})
+
+    assert result.method_used == "case_based_analysis"
+    assert big_o_str_from_expr(result.big_o) == "n^2"
+    assert big_o_str_from_expr(result.theta) == "n log n"
+    assert "T(n) = 2·T(n/2) + c·n" in result.recurrence_equation
+
+
+def test_quicksort_results_are_independent():
+    """Cada llamada recibe su propio resultado: modificarlo no afecta a las demás"""
+    proc = {"kind": "proc", "name": "QUICK_SORT", "body": []}
+    first = analyze_recursive_function(proc)
+    first.recurrence.a = 99
+    first.explanation = ""
+
+    second = analyze_recursive_function(proc)
+
+    assert second.recurrence.a == 1
+    assert second.explanation.startswith("QuickSort")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
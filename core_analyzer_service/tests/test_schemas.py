@@ -0,0 +1,67 @@
+"""
+Test de los esquemas de respuesta
+=================================
+
+Verifica que los modelos de respuesta y de metadatos son inmutables.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from app.schemas import (
+    ExecutionTrace,
+    FunctionMetadata,
+    LineCost,
+    StrongBounds,
+    TraceStep,
+    analyzeAstResp,
+)
+
+
+def _response():
+    return analyzeAstResp(
+        algorithm_kind="iterative",
+        big_o="n",
+        big_omega="n",
+        ir_worst={"name": "n"},
+        ir_best={"name": "n"},
+        strong_bounds=StrongBounds(formula="T(n) = n"),
+        lines=[LineCost(line=1, kind="for", cost_worst="n", cost_best="n")],
+        execution_trace=ExecutionTrace(
+            steps=[TraceStep(step=1, line=1, kind="for")],
+            total_iterations=1,
+            max_depth=1,
+            variables_tracked=["i"],
+            complexity_formula="n",
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "get_model, field, value",
+    [
+        (lambda resp: resp, "big_o", "1"),
+        (lambda resp: resp.strong_bounds, "formula", "T(n) = 1"),
+        (lambda resp: resp.lines[0], "cost_worst", "1"),
+        (lambda resp: resp.execution_trace, "total_iterations", 2),
+        (lambda resp: resp.execution_trace.steps[0], "cost", "2"),
+    ],
+)
+def test_response_models_are_frozen(get_model, field, value):
+    """Los campos de la respuesta y de sus submodelos no se pueden reasignar"""
+    model = get_model(_response())
+
+    with pytest.raises(ValidationError):
+        setattr(model, field, value)
+
+
+def test_function_metadata_is_frozen():
+    """Los metadatos de función no se pueden reasignar"""
+    meta = FunctionMetadata(name="F", is_recursive=True, calls=["F"])
+
+    with pytest.raises(ValidationError):
+        meta.is_recursive = False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])